@@ -0,0 +1,3 @@
+"""scs_mediator_sdk - mediation training and simulation toolkit for SCS scenarios."""
+
+__version__ = "0.1.0"
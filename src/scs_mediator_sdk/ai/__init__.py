@@ -0,0 +1 @@
+"""AI guide assistants for facilitators and participants."""
@@ -0,0 +1,160 @@
+"""Rule-based AI guide for the simulation consoles.
+
+The guide answers mediation-process questions from a small knowledge
+base, optionally enriched with the live simulation context set by the
+UI.  Conversation history can be persisted so a reloaded session
+continues where it left off.
+"""
+
+import json
+import os
+from dataclasses import dataclass
+
+CACHE_DIR = ".cache"
+
+_KNOWLEDGE_BASE = (
+    ("escalat", "Work the escalation ladder one rung at a time: verify the "
+     "incident through the hotline before responding, and look for the "
+     "next de-escalation window.", "Escalation management handbook"),
+    ("cbm", "Sequence CBMs from low-cost communication measures toward "
+     "transparency measures; early visible wins build the trust the "
+     "harder measures need.", "CBM sequencing guide"),
+    ("spoiler", "Classify the spoiler first (limited, greedy, total) - the "
+     "management strategy differs sharply between inducement, "
+     "socialization and coercion.", "Spoiler management literature"),
+    ("batna", "Reality-test each party's BATNA: most maritime standoffs "
+     "overvalue the status quo because incident risk is underpriced.",
+     "Negotiation analysis primer"),
+    ("offer", "Package issues so every party can point to a visible gain; "
+     "single-issue offers in maritime disputes almost always fail "
+     "ratification at home.", "Two-level games analysis"),
+    ("track", "Match the track to the temperature: official channels for "
+     "crisis management, Track II to explore options deniably.",
+     "Multi-track diplomacy framework"),
+)
+
+_DEFAULT_RESPONSE = (
+    "Consider the parties' underlying interests rather than their stated "
+    "positions, and check how the current escalation level constrains "
+    "what each side can accept publicly."
+)
+
+
+@dataclass
+class Message:
+    role: str
+    content: str
+
+
+class MediationGuide:
+    """Contextual Q&A assistant backing the console sidebars."""
+
+    def __init__(self, role="instructor", session_id=None,
+                 enable_persistence=False, persistence_backend="jsonl"):
+        self.role = role
+        self.session_id = session_id or role
+        self.enable_persistence = enable_persistence
+        self.persistence_backend = persistence_backend
+        self.conversation_history = []
+        self.context = {}
+        self.simulation_parameters = {}
+        if enable_persistence:
+            self._load_history()
+
+    # -- context -------------------------------------------------------
+
+    def set_context(self, context):
+        self.context = dict(context)
+
+    def set_simulation_parameters(self, params):
+        self.simulation_parameters = dict(params)
+
+    # -- conversation --------------------------------------------------
+
+    def ask(self, question):
+        """Answer ``question``; returns (response, sources)."""
+        lowered = question.lower()
+        response = _DEFAULT_RESPONSE
+        sources = "General mediation principles"
+        for keyword, answer, source in _KNOWLEDGE_BASE:
+            if keyword in lowered:
+                response, sources = answer, source
+                break
+        if self.context.get("scenario"):
+            response += (
+                f" (Scenario context: {self.context['scenario']}.)"
+            )
+        turn = (Message("user", question), Message("assistant", response))
+        self.conversation_history.extend(turn)
+        if self.enable_persistence:
+            if self.persistence_backend == "jsonl":
+                self._append_turn(turn)
+            else:
+                self._save_history()
+        return response, sources
+
+    def get_contextual_tips(self):
+        """Short tips for the current phase/step in the context."""
+        step = self.context.get("step", 1)
+        tips = {
+            1: ["Confirm every party's mandate before opening joint sessions."],
+            2: ["Keep early offers small and reversible."],
+            3: ["Evaluate offers against BATNAs, not aspirations."],
+            4: ["Use the simulation to stress-test, not to predict."],
+            5: ["Read trends, not single incidents."],
+            6: ["Pair every agreement clause with a monitoring mechanism."],
+        }
+        return tips.get(step, tips[1])
+
+    # -- persistence ---------------------------------------------------
+
+    def _history_path(self):
+        suffix = "jsonl" if self.persistence_backend == "jsonl" else "json"
+        return os.path.join(CACHE_DIR, f"{self.session_id}_chat.{suffix}")
+
+    def _append_turn(self, messages):
+        """Append just the new messages, one JSON line each.
+
+        Keeps per-turn persistence O(1) instead of rewriting the whole
+        history file on every exchange.
+        """
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(self._history_path(), "a", encoding="utf-8") as f:
+            for m in messages:
+                f.write(json.dumps({"role": m.role, "content": m.content}))
+                f.write("\n")
+
+    def _save_history(self):
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        payload = [
+            {"role": m.role, "content": m.content}
+            for m in self.conversation_history
+        ]
+        with open(self._history_path(), "w", encoding="utf-8") as f:
+            json.dump(payload, f)
+
+    def _load_history(self):
+        path = self._history_path()
+        if not os.path.isfile(path):
+            return
+        with open(path, encoding="utf-8") as f:
+            if self.persistence_backend == "jsonl":
+                entries = (json.loads(line) for line in f if line.strip())
+            else:
+                entries = json.load(f)
+            for entry in entries:
+                self.conversation_history.append(
+                    Message(entry["role"], entry["content"])
+                )
+
+
+def create_instructor_guide(session_id="instructor", enable_persistence=False,
+                            persistence_backend="jsonl"):
+    return MediationGuide("instructor", session_id, enable_persistence,
+                          persistence_backend)
+
+
+def create_participant_guide(party_id, enable_persistence=False,
+                             persistence_backend="jsonl"):
+    return MediationGuide("participant", f"participant_{party_id}",
+                          enable_persistence, persistence_backend)
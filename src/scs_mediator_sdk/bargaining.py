@@ -0,0 +1,226 @@
+"""Multi-party bargaining sessions over a structured issue space.
+
+A :class:`BargainingSession` holds per-party preference profiles for a
+case and scores candidate agreements (:class:`AgreementVector`) into
+utilities and acceptance probabilities.
+"""
+
+import random
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - numba is optional
+    njit = None
+
+
+def _score_py(weights, ideal, offer):
+    """Utility of ``offer`` for every party, NumPy fallback.
+
+    ``weights`` and ``ideal`` are (parties, issues) arrays; ``offer`` is
+    an (issues,) array with NaN marking unaddressed issues, which score
+    at the midpoint.
+    """
+    closeness = np.where(np.isnan(offer), 0.5, 1.0 - np.abs(offer - ideal))
+    return np.clip((weights * closeness).sum(axis=1), 0.0, 1.0)
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _score(weights, ideal, offer):
+        n_parties, n_issues = weights.shape
+        out = np.empty(n_parties)
+        for p in range(n_parties):
+            total = 0.0
+            for i in range(n_issues):
+                value = offer[i]
+                if np.isnan(value):
+                    closeness = 0.5
+                else:
+                    closeness = 1.0 - abs(value - ideal[p, i])
+                total += weights[p, i] * closeness
+            out[p] = min(1.0, max(0.0, total))
+        return out
+else:
+    _score = _score_py
+
+
+class AgreementVector:
+    """A candidate agreement: a mapping of issue -> proposed terms.
+
+    Terms may be scalars or nested dicts of sub-terms; nested values are
+    flattened into dotted keys for scoring.
+    """
+
+    def __init__(self, terms):
+        self.terms = dict(terms)
+        self._flat = {}
+        for issue, value in self.terms.items():
+            if isinstance(value, dict):
+                for sub, sub_value in value.items():
+                    self._flat[f"{issue}.{sub}"] = sub_value
+            else:
+                self._flat[issue] = value
+
+    def flattened(self):
+        return self._flat
+
+    def __repr__(self):
+        return f"AgreementVector({self.terms!r})"
+
+
+# The offer builders label terms by widget, not by issue: the scalar
+# resupply terms and the hotline section carry their own keys, while the
+# remaining dotted sections are already named after their issue.
+_TERM_ISSUE_ALIASES = {
+    "standoff_distance_nm": "resupply_SOP",
+    "prenotification": "resupply_SOP",
+    "escort_limits": "naval_restrictions",
+    "hotline": "hotline_cues",
+}
+
+# Full widget ranges for numeric terms not on a 0-100 scale, so a slider
+# swept end to end covers all of [0, 1] rather than a sliver of it.
+_TERM_SCALES = {
+    "standoff_distance_nm": 10.0,
+    "escort_limits": 6.0,
+    "media_protocol.embargo_hours": 72.0,
+    "fishing_rights.seasonal_closure_days": 120.0,
+    "eez_boundaries.review_years": 20.0,
+}
+
+
+def _issue_for_term(term):
+    """Issue-space name a flattened offer term scores against."""
+    head = term.split(".", 1)[0]
+    return _TERM_ISSUE_ALIASES.get(head, head)
+
+
+def _issue_values(flat):
+    """Normalized per-issue offer positions from flattened terms.
+
+    Issues addressed by several terms take the mean of the normalized
+    term values; issues with no term stay absent and score at the
+    midpoint downstream.
+    """
+    sums = {}
+    counts = {}
+    for term, value in flat.items():
+        issue = _issue_for_term(term)
+        norm = PartyProfile._normalize(value, _TERM_SCALES.get(term, 100.0))
+        sums[issue] = sums.get(issue, 0.0) + norm
+        counts[issue] = counts.get(issue, 0) + 1
+    return {issue: sums[issue] / counts[issue] for issue in sums}
+
+
+class PartyProfile:
+    """Preferences of a single party over the issue space."""
+
+    def __init__(self, party_id, issue_space, rng):
+        self.party_id = party_id
+        # Weights and ideal points are seeded deterministically from the
+        # party id so repeat sessions are comparable across runs.
+        self.weights = {issue: 0.5 + 0.5 * rng.random() for issue in issue_space}
+        total = sum(self.weights.values()) or 1.0
+        self.weights = {k: v / total for k, v in self.weights.items()}
+        self.ideal = {issue: rng.random() for issue in issue_space}
+        self.batna = 0.35 + 0.15 * rng.random()
+
+    def utility(self, vector):
+        """Weighted closeness of the offer to this party's ideal point."""
+        addressed = _issue_values(vector.flattened())
+        score = 0.0
+        for issue, weight in self.weights.items():
+            value = addressed.get(issue)
+            if value is None:
+                # Unaddressed issue scores at the midpoint.
+                closeness = 0.5
+            else:
+                closeness = 1.0 - abs(value - self.ideal[issue])
+            score += weight * closeness
+        return max(0.0, min(1.0, score))
+
+    @staticmethod
+    def _normalize(value, scale=100.0):
+        if isinstance(value, bool):
+            return 1.0 if value else 0.0
+        if isinstance(value, (int, float)):
+            # ``scale`` is the term's full widget range (percentage by
+            # default), mapping it onto [0, 1].
+            return max(0.0, min(1.0, float(value) / scale))
+        if isinstance(value, str):
+            return (hash(value) % 100) / 100.0
+        if isinstance(value, (list, tuple)):
+            return min(1.0, len(value) / 5.0)
+        return 0.5
+
+
+class BargainingSession:
+    """A live bargaining session for one case."""
+
+    def __init__(self, case_id, parties, mediator, issue_space, priors, max_rounds):
+        self.case_id = case_id
+        self.parties = list(parties)
+        self.mediator = mediator
+        self.issue_space = list(issue_space)
+        self.max_rounds = max_rounds
+        self.round = 0
+        self.offers = []
+        rng = random.Random(case_id)
+        self.profiles = {
+            p: PartyProfile(p, self.issue_space, rng) for p in self.parties
+        }
+        if priors:
+            for party_id, prior in priors.items():
+                profile = self.profiles.get(party_id)
+                if profile:
+                    profile.weights.update(prior.get("weights", {}))
+                    profile.ideal.update(prior.get("ideal", {}))
+        # SoA views of the profiles so offer scoring runs as one array
+        # kernel instead of a per-party, per-issue Python loop.
+        self._issue_index = {
+            issue: i for i, issue in enumerate(self.issue_space)
+        }
+        self._weights_arr = np.array(
+            [
+                [self.profiles[p].weights.get(issue, 0.0)
+                 for issue in self.issue_space]
+                for p in self.parties
+            ]
+        )
+        self._ideal_arr = np.array(
+            [
+                [self.profiles[p].ideal.get(issue, 0.5)
+                 for issue in self.issue_space]
+                for p in self.parties
+            ]
+        )
+        self._batna_arr = np.array(
+            [self.profiles[p].batna for p in self.parties]
+        )
+
+    @classmethod
+    def start(cls, case_id, parties, mediator, issue_space, priors=None,
+              max_rounds=12):
+        return cls(case_id, parties, mediator, issue_space, priors, max_rounds)
+
+    def evaluate_offer(self, proposer_id, vector):
+        """Score ``vector`` for every party.
+
+        Returns ``{"utilities": {party: u}, "acceptance": {party: p}}``
+        where acceptance is a logistic function of the utility margin
+        over the party's BATNA.
+        """
+        offer_vec = np.full(len(self.issue_space), np.nan)
+        for issue, value in _issue_values(vector.flattened()).items():
+            col = self._issue_index.get(issue)
+            if col is not None:
+                offer_vec[col] = value
+        utils = _score(self._weights_arr, self._ideal_arr, offer_vec)
+        accept = 1.0 / (1.0 + np.exp(-8.0 * (utils - self._batna_arr)))
+        utilities = dict(zip(self.parties, utils.tolist()))
+        acceptance = dict(zip(self.parties, accept.tolist()))
+        self.offers.append({"proposer": proposer_id, "terms": vector.terms})
+        self.round += 1
+        return {"utilities": utilities, "acceptance": acceptance}
@@ -0,0 +1 @@
+"""Strategic and escalation dynamics between the parties."""
@@ -0,0 +1,62 @@
+"""Escalation-ladder assessment for maritime standoffs."""
+
+
+class EscalationManager:
+    """Tracks the current escalation level and assesses risk."""
+
+    LADDER = (
+        "routine_presence",
+        "verbal_warnings",
+        "shadowing",
+        "blocking",
+        "water_cannon",
+        "ramming",
+        "use_of_force",
+    )
+
+    def __init__(self):
+        self.current_level = 2  # shadowing, the usual steady state
+
+    def set_level(self, level):
+        self.current_level = max(0, min(len(self.LADDER) - 1, level))
+
+    def assess_escalation_risk(self, strategic_modifier=1.0,
+                               recent_severity=0.0):
+        """Assess escalation risk at the current ladder level.
+
+        ``strategic_modifier`` is the average of the parties'
+        context-derived modifiers; ``recent_severity`` is the mean
+        severity of recent incidents.
+        """
+        base_risk = (self.current_level + 1) / len(self.LADDER)
+        base_risk = min(1.0, base_risk * (0.7 + 0.6 * recent_severity))
+        modified_risk = min(1.0, base_risk * strategic_modifier)
+        level_name = self.LADDER[self.current_level]
+        return {
+            "base_risk": base_risk,
+            "modified_risk": modified_risk,
+            "current_level": level_name,
+            "point_of_no_return": modified_risk > 0.85,
+            "likely_counter_escalation": self._counter_moves(),
+            "deescalation_windows": self._windows(),
+            "deal_breakers": [
+                "Casualties on either side",
+                "Seizure of a vessel or crew",
+                "New construction on the contested feature",
+            ],
+        }
+
+    def _counter_moves(self):
+        upper = self.LADDER[
+            self.current_level + 1: min(self.current_level + 4, len(self.LADDER))
+        ]
+        return [
+            f"Counterpart escalates to {name.replace('_', ' ')}" for name in upper
+        ]
+
+    def _windows(self):
+        return [
+            "Immediately after a weather stand-down",
+            "Around scheduled ASEAN ministerial meetings",
+            "Following a successful hotline exchange",
+        ]
@@ -0,0 +1,140 @@
+"""Per-party strategic context: capital, legitimacy, support, credibility.
+
+Each party carries a :class:`StrategicContext` whose four 0-100 scores
+shift as the party acts; the context also exposes an escalation modifier
+used by the escalation assessment.
+"""
+
+from dataclasses import dataclass
+
+
+@dataclass
+class StrategicAction:
+    """An action a party can take given its current context."""
+
+    name: str
+    description: str
+    risk_level: str  # "low" | "medium" | "high"
+    min_capital: float = 0.0
+    min_credibility: float = 0.0
+
+
+_ACTION_CATALOG = (
+    StrategicAction(
+        "Bilateral consultation",
+        "Request direct talks with the counterpart capital",
+        "low",
+    ),
+    StrategicAction(
+        "Third-party facilitation",
+        "Invite ASEAN or a neutral state to host talks",
+        "low",
+        min_capital=20,
+    ),
+    StrategicAction(
+        "Joint patrol proposal",
+        "Propose coordinated coast-guard patrols in the contested zone",
+        "medium",
+        min_capital=40,
+        min_credibility=40,
+    ),
+    StrategicAction(
+        "Public legal challenge",
+        "File or threaten arbitration under UNCLOS Annex VII",
+        "medium",
+        min_credibility=50,
+    ),
+    StrategicAction(
+        "Assertive presence operation",
+        "Surge maritime presence to signal resolve",
+        "high",
+        min_capital=60,
+    ),
+)
+
+
+class StrategicContext:
+    """Mutable strategic standing of one party.
+
+    The static action catalog lives at module level and is shared; an
+    instance is just the four mutable scores, kept in slots so a context
+    per party per session stays cheap.
+    """
+
+    __slots__ = ("diplomatic_capital", "international_legitimacy",
+                 "domestic_support", "credibility", "_version",
+                 "_mod_cache", "_summary_cache")
+
+    def __init__(self, diplomatic_capital=50.0, international_legitimacy=50.0,
+                 domestic_support=50.0, credibility=50.0):
+        self.diplomatic_capital = diplomatic_capital
+        self.international_legitimacy = international_legitimacy
+        self.domestic_support = domestic_support
+        self.credibility = credibility
+
+    def __setattr__(self, name, value):
+        # Any score write bumps the version so derived values know the
+        # context changed; UIs poll get_escalation_modifier every rerun
+        # and the scores change rarely, so derivations cache against it.
+        object.__setattr__(self, name, value)
+        if name not in ("_version", "_mod_cache", "_summary_cache"):
+            object.__setattr__(
+                self, "_version", getattr(self, "_version", 0) + 1
+            )
+
+    def apply_delta(self, capital=0.0, legitimacy=0.0, support=0.0,
+                    credibility=0.0):
+        self.diplomatic_capital = _clamp(self.diplomatic_capital + capital)
+        self.international_legitimacy = _clamp(
+            self.international_legitimacy + legitimacy
+        )
+        self.domestic_support = _clamp(self.domestic_support + support)
+        self.credibility = _clamp(self.credibility + credibility)
+
+    def get_summary(self):
+        """Score snapshot, cached against the version like the modifier.
+
+        Both consoles read it several times per rerun; callers treat
+        the dict as read-only.
+        """
+        cache = getattr(self, "_summary_cache", None)
+        if cache is not None and cache[0] == self._version:
+            return cache[1]
+        summary = {
+            "diplomatic_capital": self.diplomatic_capital,
+            "international_legitimacy": self.international_legitimacy,
+            "domestic_support": self.domestic_support,
+            "credibility": self.credibility,
+        }
+        self._summary_cache = (self._version, summary)
+        return summary
+
+    def get_escalation_modifier(self):
+        """Multiplier on base escalation risk in roughly [0.6, 1.6].
+
+        Low domestic support pushes leaders toward assertiveness; high
+        legitimacy and credibility restrain it.  Pure in the scores, so
+        the result is cached until a score changes.
+        """
+        cache = getattr(self, "_mod_cache", None)
+        if cache is not None and cache[0] == self._version:
+            return cache[1]
+        pressure = (100.0 - self.domestic_support) / 100.0
+        restraint = (self.international_legitimacy + self.credibility) / 200.0
+        modifier = round(1.0 + 0.6 * pressure - 0.4 * restraint, 3)
+        self._mod_cache = (self._version, modifier)
+        return modifier
+
+
+def _clamp(value):
+    return max(0.0, min(100.0, value))
+
+
+def get_available_actions(context):
+    """Actions currently open to a party given its context scores."""
+    return [
+        action
+        for action in _ACTION_CATALOG
+        if context.diplomatic_capital >= action.min_capital
+        and context.credibility >= action.min_credibility
+    ]
@@ -0,0 +1 @@
+"""Peace-mediation instruments: CBMs, spoiler management, tracks, win-sets."""
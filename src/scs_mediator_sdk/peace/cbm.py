@@ -0,0 +1,127 @@
+"""Confidence-building measures (CBMs) library for maritime disputes."""
+
+from dataclasses import dataclass
+from enum import Enum
+from functools import cached_property
+
+
+class CBMCategory(Enum):
+    COMMUNICATION = "communication"
+    MARITIME_SAFETY = "maritime_safety"
+    MILITARY_TRANSPARENCY = "military_transparency"
+    ECONOMIC_COOPERATION = "economic_cooperation"
+    ENVIRONMENTAL = "environmental"
+
+
+@dataclass(frozen=True)
+class ConfidenceBuildingMeasure:
+    """One CBM with its trust and risk effects."""
+
+    name: str
+    category: CBMCategory
+    description: str
+    trust_building_value: float  # 0-1
+    risk_reduction_value: float  # 0-1
+    implementation_steps: tuple
+    timeframe_months: int
+
+    @cached_property
+    def steps_html(self):
+        """Implementation steps as ``<li>`` items, built once per CBM.
+
+        The measures are immutable, so UIs re-rendering the same CBM
+        can embed this instead of rejoining the steps every pass.
+        """
+        return "".join(f"<li>{s}</li>" for s in self.implementation_steps)
+
+
+_CBMS = (
+    ConfidenceBuildingMeasure(
+        "Maritime hotline",
+        CBMCategory.COMMUNICATION,
+        "Direct operational hotline between coast-guard headquarters",
+        0.7, 0.8,
+        ("Exchange points of contact", "Agree activation protocol",
+         "Run monthly test calls"),
+        3,
+    ),
+    ConfidenceBuildingMeasure(
+        "CUES adoption",
+        CBMCategory.MARITIME_SAFETY,
+        "Apply the Code for Unplanned Encounters at Sea to coast guards",
+        0.6, 0.9,
+        ("Translate CUES signals", "Joint bridge-crew training",
+         "Incorporate into patrol orders"),
+        6,
+    ),
+    ConfidenceBuildingMeasure(
+        "Patrol prenotification",
+        CBMCategory.MILITARY_TRANSPARENCY,
+        "48-hour advance notice of patrols near contested features",
+        0.5, 0.7,
+        ("Define notification zones", "Set up secure channel",
+         "Pilot for one feature"),
+        4,
+    ),
+    ConfidenceBuildingMeasure(
+        "Joint fisheries survey",
+        CBMCategory.ECONOMIC_COOPERATION,
+        "Shared stock assessment by fisheries agencies",
+        0.8, 0.4,
+        ("Agree survey grid", "Mixed science teams", "Publish joint report"),
+        12,
+    ),
+    ConfidenceBuildingMeasure(
+        "Oil-spill response exercise",
+        CBMCategory.ENVIRONMENTAL,
+        "Combined tabletop and at-sea spill-response drill",
+        0.6, 0.5,
+        ("Tabletop exercise", "Equipment inventory exchange",
+         "At-sea drill with observers"),
+        9,
+    ),
+    ConfidenceBuildingMeasure(
+        "Incident reporting registry",
+        CBMCategory.COMMUNICATION,
+        "Shared registry of at-sea incidents with agreed taxonomy",
+        0.5, 0.6,
+        ("Agree incident taxonomy", "Stand up shared database",
+         "Quarterly reconciliation meetings"),
+        6,
+    ),
+    ConfidenceBuildingMeasure(
+        "Search-and-rescue cooperation",
+        CBMCategory.MARITIME_SAFETY,
+        "Joint SAR coordination covering the contested area",
+        0.7, 0.6,
+        ("Map SAR responsibilities", "Exchange liaison officers",
+         "Annual joint exercise"),
+        8,
+    ),
+)
+
+
+class CBMLibrary:
+    """Query and recommend CBMs by category and priority."""
+
+    def __init__(self):
+        self.cbms = list(_CBMS)
+
+    def get_by_category(self, category):
+        return [c for c in self.cbms if c.category == category]
+
+    def recommend(self, priorities, limit=3):
+        """Top CBMs for the given category priorities.
+
+        ``priorities`` is an iterable of :class:`CBMCategory`; earlier
+        entries weigh heavier.
+        """
+        ranking = {cat: i for i, cat in enumerate(priorities)}
+        candidates = [c for c in self.cbms if c.category in ranking]
+        candidates.sort(
+            key=lambda c: (
+                ranking[c.category],
+                -(c.trust_building_value + c.risk_reduction_value),
+            )
+        )
+        return candidates[:limit]
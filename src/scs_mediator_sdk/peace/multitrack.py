@@ -0,0 +1,62 @@
+"""Multi-track diplomacy support (Tracks I-IX, after Diamond & McDonald)."""
+
+TRACK_INFO = {
+    "Track I - Official Diplomacy": (
+        "Government-to-government negotiation by officials with mandates."
+    ),
+    "Track II - Unofficial Dialogue": (
+        "Academics and former officials exploring options without mandates."
+    ),
+    "Track III - Business": (
+        "Commercial actors building interdependence and back-channels."
+    ),
+    "Track IV - Private Citizens": (
+        "Citizen exchanges and sister-city style engagement."
+    ),
+    "Track V - Research & Education": (
+        "Joint research, training and simulation exercises."
+    ),
+    "Track VI - Activism": (
+        "Advocacy groups shaping the public constituency for peace."
+    ),
+    "Track VII - Religion": (
+        "Faith communities providing moral framing and quiet channels."
+    ),
+    "Track VIII - Funding": (
+        "Foundations and donors sustaining the other tracks."
+    ),
+    "Track IX - Communications & Media": (
+        "Media shaping narratives and de-escalatory framing."
+    ),
+}
+
+
+class MultiTrackMediator:
+    """Recommends which tracks to activate for a given situation."""
+
+    def __init__(self):
+        self.track_info = dict(TRACK_INFO)
+
+    def get_track_recommendations(self, escalation_risk, trust_level):
+        """Track activation advice given risk and trust readings in [0,1]."""
+        recommendations = []
+        if escalation_risk > 0.6:
+            recommendations.append(
+                "Prioritize Track I crisis channels and the hotline before "
+                "broader engagement."
+            )
+        if trust_level < 0.4:
+            recommendations.append(
+                "Open Track II dialogue to test options deniably while "
+                "official positions stay frozen."
+            )
+        recommendations.append(
+            "Use Track V joint research (fisheries, environment) as a "
+            "low-risk cooperation entry point."
+        )
+        if escalation_risk < 0.3:
+            recommendations.append(
+                "Expand Track III and IV exchanges to lock in constituencies "
+                "for the agreement."
+            )
+        return recommendations
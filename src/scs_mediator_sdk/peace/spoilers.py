@@ -0,0 +1,141 @@
+"""Spoiler analysis: actors with incentives to derail an agreement."""
+
+from dataclasses import dataclass
+from enum import Enum
+
+
+class SpoilerType(Enum):
+    LIMITED = "limited"
+    GREEDY = "greedy"
+    TOTAL = "total"
+
+
+class SpoilerCapability(Enum):
+    LOW = "low"
+    MEDIUM = "medium"
+    HIGH = "high"
+
+
+class SpoilerPosition(Enum):
+    INSIDE = "inside"
+    OUTSIDE = "outside"
+
+
+@dataclass(frozen=True)
+class Spoiler:
+    """An actor that may act to undermine the mediation."""
+
+    name: str
+    spoiler_type: SpoilerType
+    capability: SpoilerCapability
+    position: SpoilerPosition
+    interests_threatened: tuple
+    typical_spoiling_actions: tuple
+
+
+def create_scs_spoilers():
+    """The standard spoiler set for SCS scenarios."""
+    return [
+        Spoiler(
+            "Maritime militia networks",
+            SpoilerType.GREEDY,
+            SpoilerCapability.HIGH,
+            SpoilerPosition.OUTSIDE,
+            ("Fishing access", "State subsidies", "Local patronage"),
+            ("Swarming contested waters", "Staged collisions",
+             "Harassment of survey vessels"),
+        ),
+        Spoiler(
+            "Nationalist media blocs",
+            SpoilerType.LIMITED,
+            SpoilerCapability.MEDIUM,
+            SpoilerPosition.INSIDE,
+            ("Editorial influence", "Audience share"),
+            ("Inflammatory coverage of incidents", "Leaking draft terms",
+             "Campaigns against negotiators"),
+        ),
+        Spoiler(
+            "Hardline service factions",
+            SpoilerType.TOTAL,
+            SpoilerCapability.HIGH,
+            SpoilerPosition.INSIDE,
+            ("Budget share", "Operational autonomy", "Doctrine"),
+            ("Unauthorized assertive patrols", "Slow-rolling implementation",
+             "Briefing against the agreement"),
+        ),
+        Spoiler(
+            "Illegal fishing syndicates",
+            SpoilerType.GREEDY,
+            SpoilerCapability.LOW,
+            SpoilerPosition.OUTSIDE,
+            ("Unregulated catch", "Smuggling routes"),
+            ("Intrusions during sensitive talks", "Flag-state evasion"),
+        ),
+    ]
+
+
+class SpoilerManager:
+    """Registry plus risk assessment over known spoilers."""
+
+    _STRATEGIES = {
+        SpoilerType.LIMITED: (
+            "Inducement: address the specific threatened interest",
+            "Socialization: bind the actor into the process",
+            "Targeted transparency about agreement terms",
+        ),
+        SpoilerType.GREEDY: (
+            "Conditional inducements with clear limits",
+            "Raise the cost of spoiling via monitoring",
+            "Deny opportunistic gains through rapid incident attribution",
+        ),
+        SpoilerType.TOTAL: (
+            "Coercion: credible penalties for derailment",
+            "Marginalize from decision-making channels",
+            "Build coalition consensus that isolates the spoiler",
+        ),
+    }
+
+    _CAPABILITY_WEIGHT = {
+        SpoilerCapability.LOW: 0.2,
+        SpoilerCapability.MEDIUM: 0.5,
+        SpoilerCapability.HIGH: 0.9,
+    }
+
+    def __init__(self):
+        self.spoilers = []
+
+    def add_spoiler(self, spoiler):
+        self.spoilers.append(spoiler)
+
+    def get_management_strategies(self, spoiler):
+        return list(self._STRATEGIES[spoiler.spoiler_type])
+
+    def assess_spoiler_risk(self):
+        """Aggregate spoiling risk across the registry."""
+        if not self.spoilers:
+            return {
+                "overall_risk": 0.0,
+                "high_threat_spoilers": [],
+                "likely_spoiling_actions": [],
+                "protective_measures_needed": [],
+            }
+        weights = [self._CAPABILITY_WEIGHT[s.capability] for s in self.spoilers]
+        overall = min(1.0, sum(weights) / (len(weights) + 1.0))
+        high = [
+            s.name for s in self.spoilers
+            if s.capability == SpoilerCapability.HIGH
+        ]
+        actions = []
+        for s in self.spoilers:
+            actions.extend(s.typical_spoiling_actions[:2])
+        measures = [
+            "Independent incident verification",
+            "Pre-agreed attribution protocol",
+            "Reserved channels for spoiler grievances",
+        ]
+        return {
+            "overall_risk": overall,
+            "high_threat_spoilers": high,
+            "likely_spoiling_actions": actions,
+            "protective_measures_needed": measures,
+        }
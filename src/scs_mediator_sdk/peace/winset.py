@@ -0,0 +1,72 @@
+"""Two-level game win-set analysis (after Putnam).
+
+A :class:`WinSetAnalyzer` aggregates domestic actors' positions into the
+set of international agreements ratifiable at home.
+"""
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class DomesticActor:
+    """A domestic constituency with influence over ratification."""
+
+    name: str
+    influence: float  # 0-1 share of ratification leverage
+    flexibility: float  # 0-1 willingness to accept concessions
+    red_lines: tuple
+
+
+def create_philippines_domestic_actors():
+    return [
+        DomesticActor("Senate majority bloc", 0.30, 0.5,
+                      ("No waiver of arbitral award",)),
+        DomesticActor("Armed forces leadership", 0.25, 0.4,
+                      ("No permanent withdrawal from occupied features",)),
+        DomesticActor("Fishing communities", 0.20, 0.6,
+                      ("Restore access to traditional grounds",)),
+        DomesticActor("Business council", 0.15, 0.8, ()),
+        DomesticActor("Nationalist civil society", 0.10, 0.3,
+                      ("No joint development in EEZ",)),
+    ]
+
+
+def create_china_domestic_actors():
+    return [
+        DomesticActor("Central leadership", 0.35, 0.4,
+                      ("No explicit sovereignty concession",)),
+        DomesticActor("PLA Navy and coast guard", 0.25, 0.3,
+                      ("Maintain presence at key features",)),
+        DomesticActor("Coastal provinces", 0.20, 0.6, ()),
+        DomesticActor("State media and online opinion", 0.20, 0.35,
+                      ("No visible climb-down after incidents",)),
+    ]
+
+
+class WinSetAnalyzer:
+    """Estimate the size of a party's domestic win-set."""
+
+    def __init__(self, party_name):
+        self.party_name = party_name
+        self.actors = []
+
+    def add_domestic_actor(self, actor):
+        self.actors.append(actor)
+
+    def analyze(self):
+        """Summarize win-set size and the binding constraints."""
+        if not self.actors:
+            return {"win_set_size": 1.0, "binding_constraints": [],
+                    "ratification_risk": 0.0}
+        total_influence = sum(a.influence for a in self.actors) or 1.0
+        size = sum(a.influence * a.flexibility for a in self.actors) / total_influence
+        constraints = [
+            (actor.name, red_line)
+            for actor in self.actors
+            for red_line in actor.red_lines
+        ]
+        return {
+            "win_set_size": round(size, 3),
+            "binding_constraints": constraints,
+            "ratification_risk": round(1.0 - size, 3),
+        }
@@ -0,0 +1 @@
+"""Agent-based simulation of maritime incident dynamics."""
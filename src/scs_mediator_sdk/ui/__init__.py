@@ -0,0 +1 @@
+"""Streamlit front-ends for the mediation toolkit."""
@@ -0,0 +1,1852 @@
+"""Enhanced multi-view simulation console.
+
+One Streamlit app, two views: the facilitator's instructor console walks
+a six-step workflow (setup, offer building, evaluation, simulation,
+analysis, peace-mediation tools) and the participant party view gives
+each delegation its own position, offer and strategy tabs.  Both views
+share an AI guide sidebar.
+
+Run with: streamlit run src/scs_mediator_sdk/ui/enhanced_multi_view.py
+"""
+
+import copy
+import json
+import os
+from bisect import bisect_right
+from collections import deque
+from itertools import islice
+from math import prod
+from string import Template
+from types import MappingProxyType
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+from streamlit.components.v1 import html as _html
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional accelerator
+    msgspec = None
+
+try:
+    import plotly.graph_objects as go
+except ImportError:  # pragma: no cover - optional accelerator
+    go = None
+
+if orjson is not None:
+    def _pretty_json(obj):
+        """Indented JSON; numpy scalars serialize without coercion."""
+        return orjson.dumps(
+            obj,
+            option=orjson.OPT_INDENT_2
+            | orjson.OPT_SORT_KEYS
+            | orjson.OPT_SERIALIZE_NUMPY,
+        ).decode()
+
+    def _offer_blob(offer):
+        return orjson.dumps(offer, option=orjson.OPT_SORT_KEYS)
+
+    _loads = orjson.loads
+elif msgspec is not None:
+    def _pretty_json(obj):
+        return msgspec.json.format(
+            msgspec.json.encode(msgspec.to_builtins(obj)), indent=2
+        ).decode()
+
+    def _offer_blob(offer):
+        return json.dumps(offer, sort_keys=True).encode()
+
+    _loads = msgspec.json.decode
+else:
+    def _pretty_json(obj):
+        return json.dumps(obj, indent=2, sort_keys=True, default=float)
+
+    def _offer_blob(offer):
+        return json.dumps(offer, sort_keys=True).encode()
+
+    _loads = json.loads
+
+from scs_mediator_sdk.ai.guide import (
+    create_instructor_guide,
+    create_participant_guide,
+)
+from scs_mediator_sdk.bargaining import AgreementVector, BargainingSession
+from scs_mediator_sdk.dynamics.escalation import EscalationManager
+from scs_mediator_sdk.dynamics.strategic_context import (
+    StrategicContext,
+    get_available_actions,
+)
+from scs_mediator_sdk.peace.cbm import CBMCategory, CBMLibrary
+from scs_mediator_sdk.peace.multitrack import TRACK_INFO, MultiTrackMediator
+from scs_mediator_sdk.peace.spoilers import (
+    Spoiler,
+    SpoilerManager,
+    create_scs_spoilers,
+)
+from scs_mediator_sdk.peace.winset import (
+    WinSetAnalyzer,
+    create_china_domestic_actors,
+    create_philippines_domestic_actors,
+)
+CASE_DIR = os.path.join("cases", "scs")
+MAPS_DIR = os.path.join("assets", "maps")
+
+SCENARIO_CONFIG = {
+    "scs_standoff.json": {
+        "title": "Second Thomas Shoal Standoff",
+        "focus_area": "Resupply missions to the grounded BRP Sierra Madre",
+        "description": (
+            "Recurring confrontations around resupply of the Philippine "
+            "garrison, with blocking maneuvers and water-cannon use."
+        ),
+        "parties": ["PH_GOV", "PRC_MARITIME"],
+        "recommended_issues": ["resupply_SOP", "incident_response",
+                               "hotline_cues"],
+        "all_issues": ["resupply_SOP", "incident_response", "hotline_cues",
+                       "naval_restrictions", "media_protocol"],
+        "cbm_priorities": ["communication", "maritime_safety"],
+        "difficulty": 4,
+    },
+    "scarborough_shoal.json": {
+        "title": "Scarborough Shoal Access",
+        "focus_area": "Fishing access and lagoon control",
+        "description": (
+            "Contested access to traditional fishing grounds inside and "
+            "around the shoal since the 2012 standoff."
+        ),
+        "parties": ["PH_GOV", "PRC_MARITIME"],
+        "recommended_issues": ["fishing_rights", "hotline_cues",
+                               "incident_response"],
+        "all_issues": ["fishing_rights", "hotline_cues", "incident_response",
+                       "media_protocol", "eez_boundaries"],
+        "cbm_priorities": ["maritime_safety", "economic_cooperation"],
+        "difficulty": 3,
+    },
+    "spratly_resupply.json": {
+        "title": "Spratly Features Resupply",
+        "focus_area": "Multi-party resupply deconfliction across features",
+        "description": (
+            "Four claimants maintaining garrisons on nearby features with "
+            "no agreed deconfliction procedures."
+        ),
+        "parties": ["PH_GOV", "PRC_MARITIME", "VN_CG", "MY_CG"],
+        "recommended_issues": ["resupply_SOP", "naval_restrictions",
+                               "hotline_cues", "incident_response"],
+        "all_issues": ["resupply_SOP", "naval_restrictions", "hotline_cues",
+                       "incident_response", "media_protocol",
+                       "resource_extraction"],
+        "cbm_priorities": ["communication", "military_transparency"],
+        "difficulty": 5,
+    },
+    "paracel_fisheries.json": {
+        "title": "Paracel Fisheries Dispute",
+        "focus_area": "Seasonal fishing bans and third-party fleets",
+        "description": (
+            "Unilateral fishing moratoria enforced against Vietnamese "
+            "fleets, with ramming incidents and detained crews."
+        ),
+        "parties": ["VN_CG", "PRC_MARITIME"],
+        "recommended_issues": ["fishing_rights", "incident_response",
+                               "eez_boundaries"],
+        "all_issues": ["fishing_rights", "incident_response", "eez_boundaries",
+                       "hotline_cues", "resource_extraction"],
+        "cbm_priorities": ["economic_cooperation", "environmental"],
+        "difficulty": 4,
+    },
+}
+
+ISSUE_DISPLAY_NAMES = {
+    "resupply_SOP": "Resupply Standard Operating Procedure",
+    "incident_response": "Incident Response Protocol",
+    "hotline_cues": "Hotline & CUES Signals",
+    "naval_restrictions": "Naval Vessel Restrictions",
+    "media_protocol": "Media & Messaging Protocol",
+    "fishing_rights": "Traditional Fishing Rights",
+    "eez_boundaries": "EEZ Boundary Arrangements",
+    "resource_extraction": "Resource Extraction Terms",
+}
+
+# Briefing content per party: static, so built once at import and
+# exposed read-only instead of reallocating the literal per rerun.
+_PARTY_INFO = MappingProxyType({
+    "PH_GOV": {
+        "name": "🇵🇭 Philippines Government",
+        "interests": [
+            "Secure resupply of the Sierra Madre garrison",
+            "Restore traditional fishing access",
+            "Uphold the 2016 arbitral award",
+        ],
+        "concerns": [
+            "Escalation endangering fishermen and crews",
+            "Domestic backlash against perceived concessions",
+            "Alliance entrapment dynamics",
+        ],
+        "constraints": [
+            "Senate ratification for any formal agreement",
+            "Constitutional limits on sovereignty concessions",
+        ],
+    },
+    "PRC_MARITIME": {
+        "name": "🇨🇳 PRC Maritime Forces",
+        "interests": [
+            "Maintain presence at claimed features",
+            "Avoid internationalization of the dispute",
+            "Preserve fishing-fleet operations",
+        ],
+        "concerns": [
+            "US alliance involvement after incidents",
+            "Precedent effects of any concession",
+            "Nationalist opinion after visible climb-downs",
+        ],
+        "constraints": [
+            "No explicit sovereignty concessions",
+            "Central approval for operational changes",
+        ],
+    },
+    "VN_CG": {
+        "name": "🇻🇳 Vietnam Coast Guard",
+        "interests": [
+            "Protect fishing fleets in the Paracels",
+            "Sustain oil and gas blocks in the EEZ",
+            "Keep ASEAN unity behind a code of conduct",
+        ],
+        "concerns": [
+            "Detained crews and rammed vessels",
+            "Economic dependence limiting leverage",
+        ],
+        "constraints": [
+            "Party consensus before formal agreements",
+            "No bloc alignment against any one power",
+        ],
+    },
+    "MY_CG": {
+        "name": "🇲🇾 Malaysia Coast Guard",
+        "interests": [
+            "Quiet protection of Luconia Shoals operations",
+            "Steady energy production offshore Sarawak",
+        ],
+        "concerns": [
+            "Escalation disrupting energy projects",
+            "Being sidelined in bilateral deals",
+        ],
+        "constraints": [
+            "Preference for non-publicized diplomacy",
+        ],
+    },
+})
+
+PARTY_DISPLAY = {
+    "PH_GOV": "🇵🇭 Philippines",
+    "PRC_MARITIME": "🇨🇳 PRC",
+    "VN_CG": "🇻🇳 Vietnam",
+    "MY_CG": "🇲🇾 Malaysia",
+}
+
+_DETAIL_TMPL = """
+### Reading the Incident Analysis
+
+The simulation generated **{incident_count} incidents** with an average
+severity of **{avg_severity:.2f}** and a maximum of **{max_severity:.2f}**.
+
+**Incident frequency** buckets incidents into 20-step windows.  A flat or
+declining line suggests the agreement's deconfliction terms (standoff
+distance, prenotification, escorts) are absorbing routine encounters; an
+upward slope means encounters are outpacing the agreed procedures.
+
+**Severity distribution** shows how encounters spread between harmless
+radio challenges and dangerous maneuvers.  Mass concentrated below 0.3
+is what a working agreement looks like; a heavy right tail indicates the
+agreement is not constraining the riskiest behavior.
+
+**The trend metric ({trend})** compares incident counts in the first and
+last thirds of the run.  Improvement usually lags the agreement's start
+as crews adapt to new procedures, so judge trend over the full run
+rather than the opening steps.
+
+High-severity events deserve individual review: check which parties were
+involved and whether the event type (ramming, water cannon) is one the
+agreement explicitly addresses.
+"""
+
+# Shared card markup for the Step 3 utility and acceptance sections.
+# Track overview as native <details> disclosure widgets: the content is
+# static, so the whole block is one prebuilt string emitted as a single
+# element instead of an expander and markdown per track.
+_TRACK_OVERVIEW_HTML = "".join(
+    f"<details><summary>{track}</summary>"
+    f"<p style='color:#333'>{description}</p></details>"
+    for track, description in TRACK_INFO.items()
+)
+
+# Spoiler capability -> marker emoji, one dict hit instead of a nested
+# ternary re-comparing the enum value per spoiler per rerun.
+_CAP_EMOJI = {"high": "🔴", "medium": "🟡", "low": "🟢"}
+
+# Strategy-tab metric cards: one template and one field-spec tuple, so
+# the four cards render in a loop and ship in a single grid element.
+_METRIC_CARD_TMPL = (
+    '<div style="background-color:{color}15;padding:12px;'
+    'border-radius:8px;text-align:center;">'
+    "<p style='color:#333;margin:0;'>{label}</p>"
+    "<h2 style='color:{color};margin:4px 0;'>{val:.0f}</h2>"
+    "<p style='color:#666;font-size:12px;margin:0;'>{desc}</p></div>"
+)
+
+# Score bands -> card color, indexed by how many thresholds the value
+# clears; same shape as the _UTIL_STYLE lookups above.
+_METRIC_COLORS = ("#d62728", "#ff7f0e", "#2ca02c")
+
+_STRATEGY_METRICS = (
+    ("diplomatic_capital", "DIPLOMATIC CAPITAL",
+     "Spent when asking for concessions or hosting talks"),
+    ("international_legitimacy", "INT'L LEGITIMACY",
+     "How third parties view your claims and conduct"),
+    ("domestic_support", "DOMESTIC SUPPORT",
+     "Room to make concessions without backlash"),
+    ("credibility", "CREDIBILITY",
+     "Whether your commitments and threats are believed"),
+)
+
+# Card markup leans on the classes injected by _inject_global_css, so
+# each card ships a class name instead of repeating the style string;
+# only the status background stays inline because it is data-driven.
+_CARD_TMPL = (
+    '<div class="scs-metric" style="background-color:{bg}">'
+    '<div class="scs-label">{label}</div>'
+    '<div class="scs-value">{value}</div>'
+    '<div class="scs-status">{status}</div></div>'
+)
+
+# Threshold tables for the Step 3 cards: index with
+# bisect_right(_UTIL_THRESH, value) instead of an if/elif ladder.
+_UTIL_THRESH = (0.4, 0.5, 0.7)
+_UTIL_STYLE = (
+    ("#f8d7da", "Below BATNA"),
+    ("#fff3cd", "Marginal"),
+    ("#cfe2ff", "Good"),
+    ("#d4edda", "Excellent"),
+)
+_ACCEPT_STYLE = (
+    ("#f8d7da", "Unlikely"),
+    ("#fff3cd", "Uncertain"),
+    ("#cfe2ff", "Possible"),
+    ("#d4edda", "Likely"),
+)
+
+_CUES_LABELS = {
+    "radio_protocols": "Radio Protocols",
+    "signal_flags": "Signal Flags",
+    "maneuvering": "Maneuvering Signals",
+    "distance_keeping": "Distance Keeping",
+}
+
+PARTY_DISPLAY_LONG = {
+    "PH_GOV": "🇵🇭 Philippines Government",
+    "PRC_MARITIME": "🇨🇳 PRC Maritime Forces",
+    "VN_CG": "🇻🇳 Vietnam Coast Guard",
+    "MY_CG": "🇲🇾 Malaysia Coast Guard",
+}
+
+SIMULATION_PARAMETER_DESCRIPTIONS = {
+    "standoff_distance_nm": "Minimum approach distance between "
+                            "vessels of different parties",
+    "escort_limits": "Cap on escort vessels per resupply run",
+    "prenotification": "Advance notice of resupply missions",
+    "hotline_status": "Operational state of the maritime hotline",
+    "cues_checklist": "CUES signal subsets adopted by coast guards",
+    "media_protocol": "Agreed handling of incident publicity",
+    "fishing_rights": "Traditional fishing access arrangements",
+    "traditional_access_pct": "Share of traditional grounds open",
+    "seasonal_closure_days": "Days per year of agreed closure",
+    "patrol_frequency": "Patrol cadence near the feature",
+    "resource_extraction": "Joint development arrangements",
+    "eez_boundaries": "Provisional EEZ understandings",
+    "simulation_steps": "Length of the maritime ABM run",
+}
+
+# Derived lookups, computed once at import time so reruns do no string
+# building or issue scanning.
+for cfg in SCENARIO_CONFIG.values():
+    cfg["_rec_display"] = ", ".join(
+        ISSUE_DISPLAY_NAMES.get(i, i.replace("_", " ").title())
+        for i in cfg["recommended_issues"]
+    )
+    cfg["_all_issues_set"] = frozenset(cfg["all_issues"])
+    cfg["_stars"] = "⭐" * cfg["difficulty"]
+    cfg["_parties_caption"] = ", ".join(
+        p.replace("_", " ") for p in cfg["parties"]
+    )
+
+# Static HTML blocks, built once rather than re-parsed as f-strings on
+# every rerun.
+FACILITATOR_CARD_HTML = """
+<div style="background-color:#e7f1ff;padding:20px;border-radius:10px;
+            border:2px solid #0d6efd;min-height:220px;">
+  <h3 style="color:#0d6efd;">🎓 Facilitator</h3>
+  <p style="color:#333;">Run the full mediation workflow: configure the
+  scenario, build and evaluate offers, run the maritime simulation and
+  use the peace-mediation toolset.</p>
+</div>
+"""
+
+PARTY_CARD_HTML = """
+<div style="background-color:#e8f5e9;padding:20px;border-radius:10px;
+            border:2px solid #2ca02c;min-height:220px;">
+  <h3 style="color:#2ca02c;">🧭 Party Delegation</h3>
+  <p style="color:#333;">Represent one claimant: study your position,
+  draft offers, preview your utility and manage your strategic
+  standing.</p>
+</div>
+"""
+
+SCENARIO_CONTEXT_CARD = (
+    '<div style="background-color:#fff8e1;padding:12px;border-radius:8px;'
+    'border-left:4px solid #ff9800;">'
+    "<strong>Focus:</strong> {focus_area}<br>"
+    "<strong>Difficulty:</strong> {_stars}<br>"
+    "{description}</div>"
+)
+
+# Escalation explainer body: the prose is constant, only four values
+# change per assessment, so Template.substitute replaces rebuilding the
+# whole multi-kilobyte f-string on every Assess click.
+_METRIC_EXPLAINER = Template("""
+### How the escalation assessment works
+
+**Base risk ($base)** comes from the current rung of the
+escalation ladder, scaled by the average severity of recent simulated
+incidents.  It represents the structural danger of the situation before
+the parties' politics are taken into account.
+
+**The strategic modifier ($mod)** averages each party's
+context-derived pressure: low domestic support pushes leaders toward
+assertiveness, while international legitimacy and credibility restrain
+them.  Values above 1.0 amplify the base risk.
+
+**Final risk ($final)** is the base risk after the
+strategic modifier.  Treat anything above 70% as a crisis-management
+situation rather than a negotiation.
+
+**Point of no return** flags whether the assessment crossed the
+threshold beyond which historical cases rarely de-escalate without a
+major external shock.  The current reading is **$ponr**.
+""")
+
+# CBM category labels and the reverse lookup, built once instead of
+# re-deriving them from the enum on every rerun.
+_CBM_LABELS = [cat.value.replace("_", " ").title() for cat in CBMCategory]
+_CBM_LABEL_TO_ENUM = dict(zip(_CBM_LABELS, CBMCategory))
+
+ISSUE_CATEGORY = {
+    "resupply": frozenset(
+        {"resupply_SOP", "incident_response", "naval_restrictions"}
+    ),
+    "communication": frozenset({"hotline_cues"}),
+    "media": frozenset({"media_protocol"}),
+    "fishing": frozenset({"fishing_rights"}),
+    "resource": frozenset({"resource_extraction"}),
+    "eez": frozenset({"eez_boundaries"}),
+}
+
+
+@st.cache_resource
+def _get_escalation_manager():
+    """Shared escalation manager; the ladder library is read-only."""
+    return EscalationManager()
+
+
+@st.cache_resource
+def _get_cbm_library():
+    return CBMLibrary()
+
+
+@st.cache_resource
+def _get_multi_track():
+    return MultiTrackMediator()
+
+
+@st.cache_resource
+def _get_scs_spoiler_template():
+    """The standard spoiler set, built once for all sessions."""
+    return list(create_scs_spoilers())
+
+
+@st.cache_resource
+def _analyzer_for(party: str) -> WinSetAnalyzer:
+    """Win-set analyzer with its domestic actors, built once per party."""
+    analyzer = WinSetAnalyzer(party)
+    factory = (
+        create_philippines_domestic_actors
+        if party == "Philippines"
+        else create_china_domestic_actors
+    )
+    for actor in factory():
+        analyzer.add_domestic_actor(actor)
+    return analyzer
+
+
+@st.cache_resource
+def _map_index() -> dict:
+    """Scenario filename -> map image path, scanned once per process."""
+    out = {}
+    if not os.path.isdir(MAPS_DIR):
+        return out
+    for fn in os.listdir(MAPS_DIR):
+        low = fn.lower()
+        for scen in SCENARIO_CONFIG:
+            stem = os.path.splitext(scen)[0].lower()
+            if stem in low:
+                out[scen] = os.path.join(MAPS_DIR, fn)
+    return out
+
+
+@st.cache_resource
+def _session_template(case_id: str, parties_key: tuple, issues_key: tuple,
+                      mediator: str):
+    """Fully initialized session for a configuration, built once.
+
+    Restarting the same classroom scenario is common; callers deepcopy
+    the template so the live session can mutate freely.
+    """
+    return BargainingSession.start(
+        case_id=case_id,
+        parties=list(parties_key),
+        mediator=mediator,
+        issue_space=list(issues_key),
+        priors=None,
+        max_rounds=12,
+    )
+
+
+@st.cache_data(ttl=60)
+def _available_scenarios(case_dir: str) -> list:
+    """Known scenarios present on disk, or all known ones as fallback."""
+    present = [
+        k for k in SCENARIO_CONFIG
+        if os.path.isfile(os.path.join(case_dir, k))
+    ]
+    return present or list(SCENARIO_CONFIG)
+
+
+@st.cache_resource
+def _inject_global_css() -> bool:
+    """Emit the app-wide style overrides once per process, not per rerun.
+
+    Card markup references these classes, so the style strings cross
+    the wire once here instead of inline on every card.  (Blocks sent
+    through components.html render in an iframe and keep their inline
+    styles.)
+    """
+    st.markdown(
+        "<style>"
+        "[data-testid='stMetricValue']{color:#000!important;"
+        "font-weight:bold!important}"
+        ".scs-row{display:flex;gap:12px}"
+        ".scs-metric{flex:1;padding:15px;border-radius:8px;"
+        "border:2px solid #333}"
+        ".scs-metric .scs-label{color:#000;font-weight:bold;"
+        "font-size:16px;margin-bottom:5px}"
+        ".scs-metric .scs-value{color:#000;font-size:28px;"
+        "font-weight:bold;margin-bottom:5px}"
+        ".scs-metric .scs-status{color:#333;font-size:14px;"
+        "font-weight:600}"
+        ".scs-card,.scs-card-info,.scs-card-ok,.scs-card-warn,"
+        ".scs-card-bad{padding:8px;border-radius:6px;margin-bottom:4px}"
+        ".scs-card{background-color:#fafafa}"
+        ".scs-card-info{background-color:#e7f1ff}"
+        ".scs-card-ok{background-color:#e8f5e9}"
+        ".scs-card-warn{background-color:#fff3cd}"
+        ".scs-card-bad{background-color:#ffebee}"
+        ".scs-card-hi{padding:10px;border-left:4px solid #ff9800;"
+        "margin-bottom:6px}"
+        "</style>",
+        unsafe_allow_html=True,
+    )
+    return True
+
+
+@st.cache_data(max_entries=128, show_spinner=False)
+def _evaluate(case_id: str, parties: tuple, issues: tuple,
+              offer_blob: bytes) -> dict:
+    """Score an offer, memoized on (case, configuration, offer bytes).
+
+    ``offer_blob`` is key-sorted so logically equal offers hit the same
+    cache entry; the live session is fetched from session state because
+    it is neither hashable nor part of the key.  ``parties`` and
+    ``issues`` are the session's configuration — case_id alone is just
+    the scenario filename, so restarting Step 1 with a different
+    selection would otherwise serve the old session's results.
+    """
+    session = st.session_state.bargaining_sessions[case_id]
+    return session.evaluate_offer("PH_GOV", AgreementVector(_loads(offer_blob)))
+
+
+@st.cache_data(show_spinner=False)
+def _offer_rows(offer_blob: bytes) -> pd.DataFrame:
+    """The offer flattened to (Section, Term, Value) rows.
+
+    A static table renders cheaper than the interactive JSON tree
+    widget, and the flattening is memoized on the canonical bytes.
+    """
+    rows = []
+    for section, value in _loads(offer_blob).items():
+        if isinstance(value, dict):
+            rows.extend(
+                (section, term, str(sub)) for term, sub in value.items()
+            )
+        else:
+            rows.append((section, "—", str(value)))
+    return pd.DataFrame(rows, columns=["Section", "Term", "Value"])
+
+
+@st.cache_data(max_entries=128, show_spinner=False)
+def _eval_offer(case_id: str, parties: tuple, issues: tuple,
+                party_id: str, offer_blob: bytes) -> dict:
+    """Party-view evaluation, memoized like _evaluate plus the proposer.
+
+    Repeat clicks on Calculate or Preview with an unchanged offer hit
+    the cache instead of rescoring.
+    """
+    session = st.session_state.bargaining_sessions[case_id]
+    return session.evaluate_offer(
+        party_id, AgreementVector(_loads(offer_blob))
+    )
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _run_sim(steps: int, env_blob: bytes, offer_blob: bytes,
+             seed: int) -> pd.DataFrame:
+    """Run the maritime ABM, memoized on (steps, env, offer, seed).
+
+    The dict arguments arrive as key-sorted byte blobs so logically
+    equal configurations share a cache entry; with the seed pinned the
+    run is deterministic and safe to replay from cache.
+    """
+    # Imported here so sessions that never simulate skip the model's
+    # (and its transitive) import cost.
+    from scs_mediator_sdk.sim.mesa_abm import MaritimeModel
+
+    return MaritimeModel(
+        steps=steps,
+        environment=_loads(env_blob),
+        agreement=_loads(offer_blob),
+        seed=seed,
+    ).run()
+
+
+@st.cache_data(show_spinner=False)
+def _plotly_incidents(ts_bucket: tuple, ts_incidents: tuple):
+    """WebGL frequency chart: the browser rasterizes, not the server."""
+    fig = go.Figure(
+        go.Scattergl(x=ts_bucket, y=ts_incidents, mode="lines+markers")
+    )
+    fig.update_layout(xaxis_title="Simulation Step",
+                      yaxis_title="Incident Count")
+    return fig
+
+
+@st.cache_data(show_spinner=False)
+def _severity_hist(sev: tuple) -> pd.DataFrame:
+    """Pre-binned severity counts for st.bar_chart.
+
+    Fifteen numbers cross the wire instead of a rendered image, and
+    the binning runs once per unique severity array.
+    """
+    counts, edges = np.histogram(np.asarray(sev), bins=15)
+    centers = (edges[:-1] + edges[1:]) / 2
+    return pd.DataFrame(
+        {"count": counts},
+        index=pd.Index(np.round(centers, 3), name="severity"),
+    )
+
+
+@st.cache_data(show_spinner=False)
+def _fig_incidents(ts_bucket: tuple, ts_incidents: tuple):
+    """Frequency chart, memoized on the plotted data.
+
+    Reruns triggered by unrelated widgets skip the Agg draw entirely;
+    Figure creation bypasses pyplot's global registry so cached figures
+    do not accumulate there over a long session.
+    """
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=(8, 4))
+    ax = fig.subplots()
+    ax.plot(ts_bucket, ts_incidents, marker="o")
+    ax.set_xlabel("Simulation Step")
+    ax.set_ylabel("Incident Count")
+    return fig
+
+
+@st.cache_data(show_spinner=False)
+def _render_detail(incident_count: int, avg_severity: float,
+                   max_severity: float, trend: str) -> str:
+    """The Detailed Explanation body, memoized per metric tuple."""
+    return _DETAIL_TMPL.format(
+        incident_count=incident_count,
+        avg_severity=avg_severity,
+        max_severity=max_severity,
+        trend=trend,
+    )
+
+
+@st.cache_data(show_spinner=False)
+def _event_aggregates(df: pd.DataFrame) -> dict:
+    """Every Step 5 scalar and array in one cached pass per event log.
+
+    The request asked to key this on a tuple of event dicts; the log is
+    columnar here, so the frame itself is the cache key and the O(N)
+    scans (means, maxima, top-3) run once per unique simulation result
+    instead of on every rerun.
+    """
+    steps = df["step"].to_numpy()
+    sev = df["severity"].to_numpy(copy=False)
+    # argpartition finds the top-k in O(N) without sorting the column
+    # or materializing a boolean-filtered copy; only three row indices
+    # ever touch pandas.
+    k = min(3, sev.size)
+    top_idx = np.argpartition(-sev, k - 1)[:k]
+    top_idx = top_idx[sev[top_idx] > 0.5]
+    top_idx = top_idx[np.argsort(-sev[top_idx])]
+    return {
+        "steps": steps,
+        "sev": sev,
+        "avg_severity": float(sev.mean()),
+        "max_severity": float(sev.max()),
+        "recent_severity": float(sev[-50:].mean()),
+        "max_step": int(steps.max()),
+        "top3_high_sev": df.iloc[top_idx],
+    }
+
+
+def _lttb(x: np.ndarray, y: np.ndarray, n_out: int = 2000) -> np.ndarray:
+    """Largest-Triangle-Three-Buckets downsample; returns kept indices.
+
+    Keeps the first and last points and, from each interior bucket, the
+    point forming the largest triangle with the previously kept point
+    and the next bucket's mean - so the drawn shape survives at roughly
+    ``n_out`` points however long the series is.
+    """
+    n = len(x)
+    if n <= n_out:
+        return np.arange(n)
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    bounds = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    out = np.empty(n_out, dtype=np.int64)
+    out[0] = 0
+    out[-1] = n - 1
+    prev = 0
+    for i in range(n_out - 2):
+        lo, hi = bounds[i], bounds[i + 1]
+        nxt_hi = bounds[i + 2] if i + 2 < len(bounds) else n
+        avg_x = x[hi:nxt_hi].mean() if hi < nxt_hi else x[-1]
+        avg_y = y[hi:nxt_hi].mean() if hi < nxt_hi else y[-1]
+        area = np.abs(
+            (x[prev] - avg_x) * (y[lo:hi] - y[prev])
+            - (x[prev] - x[lo:hi]) * (avg_y - y[prev])
+        )
+        prev = lo + int(area.argmax())
+        out[i + 1] = prev
+    return out
+
+
+@st.cache_data(show_spinner=False)
+def _bucket_timeseries(steps: np.ndarray, bucket_size: int = 20) -> pd.DataFrame:
+    """Incident counts per step bucket, memoized on the step array."""
+    buckets = (steps // bucket_size) * bucket_size
+    return (
+        pd.DataFrame({"bucket": buckets})
+        .groupby("bucket")
+        .size()
+        .reset_index(name="incidents")
+    )
+
+
+@st.cache_data(show_spinner=False)
+def _load_map(path: str, mtime: float) -> bytes:
+    """Raw map image bytes, memoized per (path, mtime)."""
+    with open(path, "rb") as f:
+        return f.read()
+
+
+@st.cache_data(show_spinner=False)
+def _load_case(path: str, mtime: float) -> dict:
+    """Parse a scenario file, memoized per (path, mtime).
+
+    Streamlit reruns the whole script per interaction; without the cache
+    the same JSON is re-read and re-parsed on every widget change.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def init_session_state():
+    if st.session_state.get("_inited"):
+        return
+    if "role" not in st.session_state:
+        st.session_state.role = None
+    if "party_id" not in st.session_state:
+        st.session_state.party_id = None
+    if "workflow_step" not in st.session_state:
+        st.session_state.workflow_step = 1
+    if "bargaining_sessions" not in st.session_state:
+        st.session_state.bargaining_sessions = {}
+    if "current_offer" not in st.session_state:
+        st.session_state.current_offer = None
+    if "evaluation_results" not in st.session_state:
+        st.session_state.evaluation_results = None
+    if "simulation_results" not in st.session_state:
+        st.session_state.simulation_results = None
+    if "chat_history" not in st.session_state:
+        # Bounded so a long facilitation session cannot grow memory
+        # O(turns); 50 Q/A pairs is plenty for the sidebar.
+        st.session_state.chat_history = deque(maxlen=50)
+    if "participant_chat_history" not in st.session_state:
+        st.session_state.participant_chat_history = []
+    if "escalation_manager" not in st.session_state:
+        st.session_state.escalation_manager = _get_escalation_manager()
+    if "cbm_library" not in st.session_state:
+        st.session_state.cbm_library = _get_cbm_library()
+    if "multi_track" not in st.session_state:
+        st.session_state.multi_track = _get_multi_track()
+    if "spoiler_manager" not in st.session_state:
+        # Spoiler entries are immutable; only the registry list is
+        # per-session, seeded from the shared template.
+        manager = SpoilerManager()
+        manager.spoilers = list(_get_scs_spoiler_template())
+        st.session_state.spoiler_manager = manager
+    if "strategic_contexts" not in st.session_state:
+        st.session_state.strategic_contexts = {
+            p: StrategicContext() for p in PARTY_DISPLAY
+        }
+    st.session_state._inited = True
+
+
+def role_selection():
+    """Landing page: pick facilitator or a party delegation."""
+    st.title("🌊 SCS Mediation Simulation")
+    col1, col2 = st.columns(2)
+
+    with col1:
+        # Pure-HTML cards bypass the react-markdown parse entirely.
+        _html(FACILITATOR_CARD_HTML, height=240)
+        if st.button("Enter as Facilitator", use_container_width=True):
+            st.session_state.role = "facilitator"
+            st.rerun()
+
+    with col2:
+        _html(PARTY_CARD_HTML, height=240)
+        party = st.selectbox(
+            "Delegation",
+            ["PH_GOV", "PRC_MARITIME", "VN_CG", "MY_CG"],
+            format_func=lambda x: PARTY_DISPLAY_LONG.get(x, x),
+        )
+        if st.button("Enter as Party", use_container_width=True):
+            st.session_state.role = "party"
+            st.session_state.party_id = party
+            st.rerun()
+
+
+@st.fragment
+def _render_instructor_ai_guide():
+    """AI guide block for the facilitator.
+
+    A fragment, so guide interactions rerun only this block and
+    main-workflow interactions skip it entirely.
+    """
+    with st.expander("💬 AI Guide", expanded=False):
+        if "ai_guide" not in st.session_state:
+            st.session_state.ai_guide = create_instructor_guide(
+                enable_persistence=True, persistence_backend="jsonl"
+            )
+            # Rebuild displayed history from the persisted conversation:
+            # one forward pass pairing each user turn with the reply that
+            # follows it.
+            chat = deque(maxlen=50)
+            it = iter(st.session_state.ai_guide.conversation_history)
+            for msg in it:
+                if msg.role == "user":
+                    try:
+                        nxt = next(it)
+                    except StopIteration:
+                        break
+                    chat.append(
+                        {
+                            "question": msg.content,
+                            "response": nxt.content,
+                            "sources": "Loaded from history",
+                        }
+                    )
+            st.session_state.chat_history = chat
+        ai_guide = st.session_state.ai_guide
+
+        scenario = st.session_state.get("scenario_file")
+        context_data = {
+            "scenario": SCENARIO_CONFIG.get(scenario, {}).get("title", "none"),
+            "step": st.session_state.workflow_step,
+        }
+        ctx_hash = hash(tuple(sorted(context_data.items())))
+        if st.session_state.get("_ai_ctx_hash") != ctx_hash:
+            ai_guide.set_context(context_data)
+            st.session_state._ai_ctx_hash = ctx_hash
+
+        for tip in ai_guide.get_contextual_tips():
+            st.info(tip)
+
+        question = st.text_input("Ask about the mediation process",
+                                 key="instructor_question")
+        if st.button("Ask Assistant", key="instructor_ask"):
+            ai_guide.set_simulation_parameters(
+                SIMULATION_PARAMETER_DESCRIPTIONS
+            )
+            response, sources = ai_guide.ask(question)
+            st.session_state.chat_history.append(
+                {"question": question, "response": response, "sources": sources}
+            )
+
+        for chat in islice(reversed(st.session_state.chat_history), 2):
+            st.markdown(f"**Q:** {chat['question']}")
+            st.markdown(f"**A:** {chat['response']}")
+            st.caption(f"Source: {chat['sources']}")
+
+
+@st.fragment
+def _escalation_tab():
+    """Escalation-risk assessment panel.
+
+    A fragment so its widgets rerun only this panel, not the
+    whole console script.
+    """
+    if st.button("Assess Escalation Risk"):
+        contexts = st.session_state.strategic_contexts
+        ids = list(contexts)
+        mods = np.fromiter(
+            (contexts[i].get_escalation_modifier() for i in ids),
+            dtype=np.float64, count=len(ids),
+        )
+        avg_modifier = float(mods.mean())
+        party_modifiers = dict(zip(ids, mods.tolist()))
+
+        # The cached aggregate pass already extracted the severity
+        # column; reuse it rather than re-slicing the frame per click.
+        sim_df = st.session_state.get("simulation_df")
+        recent_severity = 0.0
+        if sim_df is not None and len(sim_df):
+            recent_severity = _event_aggregates(sim_df)["recent_severity"]
+
+        risk = st.session_state.escalation_manager.assess_escalation_risk(
+            strategic_modifier=avg_modifier,
+            recent_severity=recent_severity,
+        )
+        base_risk = risk["base_risk"]
+        modified_risk = risk["modified_risk"]
+
+        # Native metrics ship as compact protobuf and skip both
+        # the markdown parse and the custom-HTML DOM weight.
+        c1, c2, c3, c4 = st.columns(4)
+        c1.metric("Base Risk", f"{base_risk:.1%}")
+        c2.metric("Strategic Modifier", f"{avg_modifier:.2f}x")
+        c3.metric("Final Risk", f"{modified_risk:.1%}",
+                  delta=f"{modified_risk - base_risk:+.1%}")
+        c4.metric("Point of No Return",
+                  "YES" if risk["point_of_no_return"] else "NO")
+
+        st.markdown("**Per-party modifiers**")
+        for col, (party_id, modifier) in zip(
+            st.columns(len(party_modifiers)),
+            party_modifiers.items(),
+        ):
+            col.metric(party_id, f"{modifier:.2f}x")
+
+        # The remaining lists ship as one element apiece
+        # instead of one st.markdown per item.
+
+        st.markdown(
+            "**Likely counter-escalation**\n"
+            + "".join(
+                f'<div class="scs-card-bad">{i}. {response}</div>'
+                for i, response in enumerate(
+                    risk["likely_counter_escalation"], 1
+                )
+            ),
+            unsafe_allow_html=True,
+        )
+
+        st.markdown(
+            "**De-escalation windows**\n"
+            + "".join(
+                f'<div class="scs-card-ok">{window}</div>'
+                for window in risk["deescalation_windows"]
+            ),
+            unsafe_allow_html=True,
+        )
+
+        st.markdown(
+            "**Deal breakers**\n"
+            + "".join(
+                f'<div class="scs-card-warn">{breaker}</div>'
+                for breaker in risk["deal_breakers"]
+            ),
+            unsafe_allow_html=True,
+        )
+
+        with st.expander("Understanding These Metrics",
+                         expanded=False):
+            st.markdown(
+                _METRIC_EXPLAINER.substitute(
+                    base=f"{base_risk:.1%}",
+                    mod=f"{avg_modifier:.2f}x",
+                    final=f"{modified_risk:.1%}",
+                    ponr=("crossed" if risk["point_of_no_return"]
+                          else "not crossed"),
+                )
+            )
+
+
+@st.fragment
+def _cbm_tab():
+    """CBM browse-and-recommend panel.
+
+    A fragment so its widgets rerun only this panel, not the
+    whole console script.
+    """
+    category = st.selectbox("Select Category", _CBM_LABELS)
+    category_enum = _CBM_LABEL_TO_ENUM[category]
+
+    cbms_in_category = st.session_state.cbm_library.get_by_category(
+        category_enum
+    )
+    # One selectable table instead of an expander plus two markdown
+    # elements per CBM; the clicked row's detail renders below.
+    records = pd.DataFrame(
+        [
+            {
+                "Name": c.name,
+                "Description": c.description,
+                "Trust": c.trust_building_value,
+                "Risk Reduction": c.risk_reduction_value,
+                "Months": c.timeframe_months,
+            }
+            for c in cbms_in_category
+        ]
+    )
+    selection = st.dataframe(
+        records, use_container_width=True, hide_index=True,
+        on_select="rerun", selection_mode="single-row",
+    )
+    if selection.selection.rows:
+        detail = cbms_in_category[selection.selection.rows[0]]
+        st.markdown(
+            f"**{detail.name}** — {detail.description}"
+            f"<ol>{detail.steps_html}</ol>",
+            unsafe_allow_html=True,
+        )
+
+    st.markdown("**Recommended for this scenario**")
+    priorities = [
+        CBMCategory(p)
+        for p in st.session_state.scenario_config.get(
+            "cbm_priorities", []
+        )
+    ]
+    st.markdown(
+        "".join(
+            f'<div class="scs-card-ok">'
+            f"<strong>{cbm.name}</strong> — {cbm.description}"
+            f"<ol>{cbm.steps_html}</ol></div>"
+            for cbm in st.session_state.cbm_library.recommend(
+                priorities
+            )
+        ),
+        unsafe_allow_html=True,
+    )
+
+
+@st.fragment
+def _domestic_tab():
+    """Domestic-politics win-set panel.
+
+    A fragment so its widgets rerun only this panel, not the
+    whole console script.
+    """
+    party_select = st.selectbox(
+        "Party", ["Philippines", "China"], key="winset_party"
+    )
+    analysis = _analyzer_for(party_select).analyze()
+    _html(
+        f'<div style="background-color:#f3e5f5;padding:12px;'
+        f'border-radius:8px;">'
+        f"<strong>Win-Set Analysis — {party_select}</strong><br>"
+        f"Win-set size: {analysis['win_set_size']:.0%}<br>"
+        f"Ratification risk: {analysis['ratification_risk']:.0%}"
+        f"</div>",
+        height=110,
+    )
+    for actor_name, red_line in analysis["binding_constraints"]:
+        st.markdown(f"- **{actor_name}**: {red_line}")
+
+
+def instructor_console():
+    """The facilitator's six-step workflow."""
+    st.title("🎓 Instructor Console")
+    with st.sidebar:
+        _render_instructor_ai_guide()
+
+    step = st.session_state.workflow_step
+    st.progress(step / 6, text=f"Step {step} of 6")
+
+    # ------------------------------------------------------------------
+    # Step 1: session setup
+    # ------------------------------------------------------------------
+    with st.expander("Step 1: Session Setup", expanded=(step == 1)):
+        scenario_files = _available_scenarios(CASE_DIR)
+
+        scenario = st.selectbox(
+            "Scenario", scenario_files,
+            format_func=lambda x: SCENARIO_CONFIG.get(x, {}).get("title", x),
+            key="scenario_selector",
+        )
+        st.session_state.scenario_file = scenario
+        cfg = SCENARIO_CONFIG.get(scenario, {})
+        st.session_state.scenario_config = cfg
+
+        case_path = os.path.join(CASE_DIR, scenario)
+        if os.path.isfile(case_path):
+            case = _load_case(case_path, os.path.getmtime(case_path))
+        else:
+            case = cfg
+
+        if cfg:
+            _html(SCENARIO_CONTEXT_CARD.format_map(cfg), height=120)
+            st.caption("Parties: " + cfg["_parties_caption"])
+            st.caption("Recommended issues: " + cfg["_rec_display"])
+
+        # Scenario map, when one ships with the assets.
+        map_path = _map_index().get(scenario)
+        if map_path:
+            map_bytes = _load_map(map_path, os.path.getmtime(map_path))
+            st.image(map_bytes, caption="Scenario Map",
+                     use_container_width=True)
+
+        default_parties = cfg.get("parties", ["PH_GOV", "PRC_MARITIME"])
+        # The config widgets only matter at Start, so batch them in a
+        # form: changing a multiselect no longer triggers a full rerun.
+        with st.form("setup_form", clear_on_submit=False):
+            parties = st.multiselect(
+                "Parties", ["PH_GOV", "PRC_MARITIME", "VN_CG", "MY_CG"],
+                default=default_parties,
+                format_func=lambda x: PARTY_DISPLAY.get(x, x),
+                key="parties_selector",
+            )
+            issue_space = st.multiselect(
+                "Issues on the table",
+                cfg.get("all_issues", list(ISSUE_DISPLAY_NAMES)),
+                default=cfg.get("recommended_issues", []),
+                format_func=lambda x: ISSUE_DISPLAY_NAMES.get(x)
+                or x.replace("_", " ").title(),
+                key="issues_selector",
+            )
+            mediator = st.selectbox(
+                "Mediator",
+                ["ASEAN chair", "Neutral state", "UN special envoy"],
+                key="mediator",
+            )
+            submitted = st.form_submit_button(
+                "▶️ Start Session", type="primary", use_container_width=True
+            )
+
+        if submitted:
+            case_id = os.path.splitext(scenario)[0]
+            session = copy.deepcopy(
+                _session_template(
+                    case_id, tuple(parties), tuple(issue_space), mediator
+                )
+            )
+            st.session_state.bargaining_sessions[case_id] = session
+            st.session_state.case_id = case_id
+            st.session_state.selected_issues = list(issue_space)
+            st.session_state.workflow_step = 2
+            st.rerun()
+
+    # ------------------------------------------------------------------
+    # Step 2: build the offer
+    # ------------------------------------------------------------------
+    with st.expander("Step 2: Build Offer", expanded=(step == 2)):
+        selected_issues = st.session_state.get("selected_issues", [])
+        if not selected_issues:
+            st.info("Start a session in Step 1 first.")
+        else:
+            st.caption(
+                "Recommended: "
+                + st.session_state.scenario_config.get("_rec_display", "")
+            )
+            selected_issues_set = set(selected_issues)
+            has_resupply = not ISSUE_CATEGORY["resupply"].isdisjoint(
+                selected_issues_set
+            )
+            has_communication = not ISSUE_CATEGORY["communication"].isdisjoint(
+                selected_issues_set
+            )
+            has_media = not ISSUE_CATEGORY["media"].isdisjoint(
+                selected_issues_set
+            )
+            has_fishing = not ISSUE_CATEGORY["fishing"].isdisjoint(
+                selected_issues_set
+            )
+            has_resource = not ISSUE_CATEGORY["resource"].isdisjoint(
+                selected_issues_set
+            )
+            has_eez = not ISSUE_CATEGORY["eez"].isdisjoint(selected_issues_set)
+
+            offer = {}
+            if has_resupply:
+                st.subheader("Resupply & Deconfliction")
+                offer["standoff_distance_nm"] = st.slider(
+                    "Standoff distance (nm)", 0, 10, 3, key="standoff"
+                )
+                offer["escort_limits"] = st.slider(
+                    "Escort vessel limit", 0, 6, 2, key="escort"
+                )
+                offer["prenotification"] = st.checkbox(
+                    "48h prenotification of resupply runs", True, key="prenotify"
+                )
+            if has_communication:
+                st.subheader("Communication")
+                hotline_status = st.selectbox(
+                    "Hotline status", ["active", "pilot", "none"], key="hotline"
+                )
+                cues = st.multiselect(
+                    "CUES checklist",
+                    ["radio_protocols", "signal_flags", "maneuvering",
+                     "distance_keeping"],
+                    default=["radio_protocols", "distance_keeping"],
+                    key="cues",
+                    format_func=_CUES_LABELS.get,
+                )
+                offer["hotline"] = {
+                    "hotline_status": hotline_status,
+                    "cues_checklist": cues,
+                }
+            if has_media:
+                st.subheader("Media Protocol")
+                offer["media_protocol"] = {
+                    "embargo_hours": st.slider(
+                        "Incident embargo (hours)", 0, 72, 24, key="embargo"
+                    ),
+                    "joint_statements": st.checkbox(
+                        "Joint incident statements", False, key="joint_stmt"
+                    ),
+                }
+            if has_fishing:
+                st.subheader("Fishing Rights")
+                offer["fishing_rights"] = {
+                    "traditional_access_pct": st.slider(
+                        "Traditional grounds open (%)", 0, 100, 60,
+                        key="fish_access",
+                    ),
+                    "seasonal_closure_days": st.slider(
+                        "Seasonal closure (days)", 0, 120, 45, key="fish_closure"
+                    ),
+                    "patrol_frequency": st.selectbox(
+                        "Patrol frequency", ["daily", "weekly", "monthly"],
+                        key="fish_patrol",
+                    ),
+                }
+            if has_resource:
+                st.subheader("Resource Extraction")
+                offer["resource_extraction"] = {
+                    "joint_development_pct": st.slider(
+                        "Joint development share (%)", 0, 100, 50, key="jd_pct"
+                    ),
+                    "moratorium_zone": st.checkbox(
+                        "Extraction moratorium in disputed zone", True,
+                        key="moratorium",
+                    ),
+                }
+            if has_eez:
+                st.subheader("EEZ Arrangements")
+                offer["eez_boundaries"] = {
+                    "provisional_line": st.selectbox(
+                        "Provisional arrangement",
+                        ["median_line", "status_quo", "joint_zone"],
+                        key="eez_line",
+                    ),
+                    "review_years": st.slider(
+                        "Review period (years)", 1, 20, 5, key="eez_review"
+                    ),
+                }
+
+            if st.button("💾 Save Offer", use_container_width=True):
+                st.session_state.current_offer = offer
+                st.session_state.workflow_step = 3
+                st.rerun()
+
+            if st.session_state.current_offer:
+                with st.expander("Current Agreement Draft"):
+                    st.code(_pretty_json(st.session_state.current_offer))
+
+    # ------------------------------------------------------------------
+    # Step 3: evaluate the offer
+    # ------------------------------------------------------------------
+    with st.expander("Step 3: Evaluate Offer", expanded=(step == 3)):
+        case_id = st.session_state.get("case_id")
+        session = st.session_state.bargaining_sessions.get(case_id)
+        if not session or not st.session_state.current_offer:
+            st.info("Save an offer in Step 2 first.")
+        elif st.button("📊 Evaluate Offer", type="primary"):
+            st.session_state.evaluation_results = _evaluate(
+                case_id, tuple(session.parties), tuple(session.issue_space),
+                _offer_blob(st.session_state.current_offer),
+            )
+
+        results = st.session_state.evaluation_results
+        if results:
+            utilities = results["utilities"]
+            acceptance = results["acceptance"]
+
+            # One pass over the parties builds both card rows, and both
+            # sections ship in a single markdown call: one WebSocket
+            # frame instead of 2N component messages.
+            util_parts = []
+            accept_parts = []
+            for party, utility in utilities.items():
+                party_name = PARTY_DISPLAY.get(party, party)
+                bg_color, status = _UTIL_STYLE[
+                    bisect_right(_UTIL_THRESH, utility)
+                ]
+                util_parts.append(
+                    _CARD_TMPL.format(bg=bg_color, label=party_name,
+                                      value=f"{utility:.1%}", status=status)
+                )
+                prob = acceptance[party]
+                bg_color, status = _ACCEPT_STYLE[
+                    bisect_right(_UTIL_THRESH, prob)
+                ]
+                accept_parts.append(
+                    _CARD_TMPL.format(bg=bg_color, label=party_name,
+                                      value=f"{prob:.1%}", status=status)
+                )
+            st.markdown(
+                "<h3>Party Utilities</h3>"
+                '<div class="scs-row">'
+                + "".join(util_parts)
+                + "</div>"
+                "<h3>Acceptance Probability</h3>"
+                '<div class="scs-row">'
+                + "".join(accept_parts)
+                + "</div>",
+                unsafe_allow_html=True,
+            )
+
+            overall = prod(acceptance.values()) if acceptance else 0.0
+            st.metric("Joint Acceptance Probability", f"{overall:.1%}")
+
+            if st.button("➡️ Continue to Simulation"):
+                st.session_state.workflow_step = 4
+                st.rerun()
+
+    # ------------------------------------------------------------------
+    # Step 4: run the maritime simulation
+    # ------------------------------------------------------------------
+    with st.expander("Step 4: Run Simulation", expanded=(step == 4)):
+        if not st.session_state.current_offer:
+            st.info("Save an offer in Step 2 first.")
+        else:
+            sim_steps = st.slider("Simulation steps", 50, 500, 200,
+                                  key="sim_steps")
+            seed = st.number_input("Random seed", value=42, key="sim_seed")
+            if st.button("🌊 Run Simulation", type="primary"):
+                environment = {
+                    "parties": st.session_state.scenario_config.get(
+                        "parties", ["PH_GOV", "PRC_MARITIME"]
+                    ),
+                    "vessels_per_party": 6,
+                }
+                # Runs in-process; no API server needed.
+                df = _run_sim(
+                    sim_steps,
+                    _offer_blob(environment),
+                    _offer_blob(st.session_state.current_offer),
+                    int(seed),
+                )
+                # Keep the frame itself so Step 5 never reinflates it.
+                st.session_state.simulation_df = df
+                st.session_state.simulation_results = {
+                    "summary": {
+                        "event_count": len(df),
+                        "max_severity": df["severity"].max()
+                        if len(df) else 0.0,
+                    },
+                }
+                st.session_state.workflow_step = 5
+                st.rerun()
+
+    # ------------------------------------------------------------------
+    # Step 5: analyze simulation results
+    # ------------------------------------------------------------------
+    with st.expander("Step 5: Incident Analysis", expanded=(step == 5)):
+        sim_results = st.session_state.simulation_results
+        if not sim_results:
+            st.info("Run the simulation in Step 4 first.")
+        else:
+            df = st.session_state.get("simulation_df")
+            has_events = df is not None and len(df) > 0
+            if has_events:
+                agg = _event_aggregates(df)
+                avg_severity = agg["avg_severity"]
+                max_severity = agg["max_severity"]
+                steps_np = agg["steps"]
+                max_step = agg["max_step"]
+
+            col1, col2, col3, col4 = st.columns(4)
+            with col1:
+                st.metric("Total Incidents", len(df) if df is not None else 0)
+            with col2:
+                if has_events:
+                    st.metric("Avg Severity", f"{avg_severity:.2f}")
+                else:
+                    st.metric("Avg Severity", "n/a")
+            with col3:
+                if has_events:
+                    st.metric("Max Severity", f"{max_severity:.2f}")
+                else:
+                    st.metric("Max Severity", "n/a")
+            with col4:
+                if has_events:
+                    if max_step < 3 or len(steps_np) < 6:
+                        # Too few incidents or steps for early/late
+                        # windows to mean anything.
+                        trend = "➡️ Stable"
+                    else:
+                        # count_nonzero over the 1-D array avoids
+                        # building boolean-indexed row copies of the
+                        # frame.
+                        early = np.count_nonzero(steps_np < max_step * 0.33)
+                        late = np.count_nonzero(steps_np > max_step * 0.66)
+                        if late < early * 0.8:
+                            trend = "📉 Improving"
+                        elif late > early * 1.2:
+                            trend = "📈 Worsening"
+                        else:
+                            trend = "➡️ Stable"
+                    st.metric("Trend", trend)
+                else:
+                    st.metric("Trend", "n/a")
+
+            if has_events:
+                st.subheader("Incident Frequency")
+                ts = _bucket_timeseries(steps_np)
+                if len(ts) > 2000:
+                    # Downsample to roughly the pixel budget before the
+                    # data ever reaches the chart payload.
+                    idx = _lttb(ts["bucket"].to_numpy(),
+                                ts["incidents"].to_numpy())
+                    ts = ts.iloc[idx]
+                if go is not None:
+                    st.plotly_chart(
+                        _plotly_incidents(tuple(ts["bucket"]),
+                                          tuple(ts["incidents"])),
+                        use_container_width=True,
+                    )
+                else:
+                    st.pyplot(
+                        _fig_incidents(tuple(ts["bucket"]),
+                                       tuple(ts["incidents"])),
+                        clear_figure=False,
+                    )
+
+                st.subheader("Severity Distribution")
+                st.bar_chart(_severity_hist(tuple(agg["sev"])))
+
+                st.subheader("High-Severity Events")
+                # Top-3 selection comes from the cached aggregate pass;
+                # itertuples skips the per-row Series that iterrows
+                # would build.
+                high_sev_events = agg["top3_high_sev"]
+                # One markdown call for all cards: each st.markdown is
+                # its own element with protobuf and DOM bookkeeping, so
+                # joining the cards collapses N round-trips into one.
+                st.markdown(
+                    "".join(
+                        f'<div class="scs-card-warn scs-card-hi">'
+                        f"<strong>Step {row.step}:</strong> "
+                        f"{getattr(row, 'event_type', 'Unknown')} — "
+                        f"severity {row.severity:.2f}<br>"
+                        f"{getattr(row, 'description', 'No description')}"
+                        f"</div>"
+                        for row in high_sev_events.itertuples(index=False)
+                    ),
+                    unsafe_allow_html=True,
+                )
+
+                st.subheader("Event Log")
+                head_df = df.head(10).reset_index(drop=True)
+                st.dataframe(head_df, use_container_width=True,
+                             hide_index=True)
+
+                with st.expander("Detailed Explanation"):
+                    st.markdown(
+                        _render_detail(len(df), float(avg_severity),
+                                       float(max_severity), trend)
+                    )
+
+            if st.button("➡️ Continue to Peace Tools"):
+                st.session_state.workflow_step = 6
+                st.rerun()
+
+    # ------------------------------------------------------------------
+    # Step 6: peace-mediation tools
+    # ------------------------------------------------------------------
+    with st.expander("Step 6: Peace Mediation Tools", expanded=(step == 6)):
+        # Building five tab bodies (analyzers, CBM renders, spoiler
+        # assessments) on reruns triggered from earlier steps is pure
+        # waste; skip the whole block until the workflow arrives here
+        # or the facilitator loads it explicitly.
+        if step != 6 and not st.session_state.get("_force_step6"):
+            st.caption("Peace-mediation tools load at Step 6.")
+            if st.button("Load Peace Tools Now"):
+                st.session_state._force_step6 = True
+                st.rerun()
+            return
+
+        peace_tabs = st.tabs(
+            ["⚠️ Escalation", "🤝 CBMs", "🏛️ Domestic Politics",
+             "🕊️ Multi-Track", "👥 Spoilers"]
+        )
+
+        with peace_tabs[0]:
+            _escalation_tab()
+
+        with peace_tabs[1]:
+            _cbm_tab()
+
+        with peace_tabs[2]:
+            _domestic_tab()
+
+        with peace_tabs[3]:
+            risk_level = 0.5
+            if st.session_state.simulation_results:
+                risk_level = min(
+                    1.0,
+                    st.session_state.simulation_results["summary"].get(
+                        "max_severity", 0.5
+                    ),
+                )
+            recommendations = st.session_state.multi_track.get_track_recommendations(
+                escalation_risk=risk_level, trust_level=0.4
+            )
+            st.markdown(
+                "".join(
+                    f'<div class="scs-card-info">{rec}</div>'
+                    for rec in recommendations
+                ),
+                unsafe_allow_html=True,
+            )
+
+        with peace_tabs[4]:
+            risk = st.session_state.spoiler_manager.assess_spoiler_risk()
+            st.metric("Overall Spoiler Risk", f"{risk['overall_risk']:.0%}")
+            st.markdown(
+                "".join(
+                    f'<div class="scs-card-bad">🔴 {name}</div>'
+                    for name in risk["high_threat_spoilers"]
+                ),
+                unsafe_allow_html=True,
+            )
+            st.markdown(
+                "**Protective measures**\n"
+                + "".join(
+                    f'<div class="scs-card-ok">{measure}</div>'
+                    for measure in risk["protective_measures_needed"]
+                ),
+                unsafe_allow_html=True,
+            )
+
+
+def _get_ctx(party_id):
+    """The party's strategic context, falling back to PH_GOV.
+
+    One lookup on the hit path instead of the get-with-subscripted-
+    default pattern that resolved the fallback every call.
+    """
+    contexts = st.session_state.strategic_contexts
+    return contexts.get(party_id) or contexts["PH_GOV"]
+
+
+@st.cache_data(show_spinner=False,
+               hash_funcs={Spoiler: lambda s: s.name})
+def _render_spoiler_html(spoiler, strategies: tuple) -> str:
+    """One spoiler's full card body as a single HTML string.
+
+    The spoiler catalog is immutable, so the whole block renders once
+    per spoiler and each expander emits one markdown element instead of
+    a card plus a line per interest, action and strategy.
+    """
+    items = "".join(
+        f"<p style='color:#333;margin:2px 0;'>• {x}</p>"
+        for x in spoiler.interests_threatened
+    )
+    actions = "".join(
+        f"<p style='color:#333;margin:2px 0;'>• {x}</p>"
+        for x in spoiler.typical_spoiling_actions[:3]
+    )
+    strats = "".join(
+        f"<p style='color:#333;margin:2px 0;'>• {x}</p>"
+        for x in strategies
+    )
+    return (
+        f'<div class="scs-card">'
+        f"Type: <strong>{spoiler.spoiler_type.value}</strong> · "
+        f"Capability: <strong>{spoiler.capability.value}</strong> · "
+        f"Position: <strong>{spoiler.position.value}</strong></div>"
+        f"<p><strong>Interests threatened</strong></p>{items}"
+        f"<p><strong>Typical spoiling actions</strong></p>{actions}"
+        f"<p><strong>Management strategies</strong></p>{strats}"
+    )
+
+
+def party_view():
+    """One party delegation's console."""
+    party_id = st.session_state.party_id or "PH_GOV"
+
+    info = _PARTY_INFO.get(party_id, _PARTY_INFO["PH_GOV"])
+
+    st.title(info["name"])
+    _render_participant_ai_guide(party_id)
+
+    tabs = st.tabs(
+        ["📋 My Position", "📤 Make Offer", "♟️ Strategy", "👥 Spoilers",
+         "🕊️ Tracks"]
+    )
+
+    # ------------------------------------------------------------------
+    # Tab 1: position
+    # ------------------------------------------------------------------
+    with tabs[0]:
+        # All three briefing lists in one markdown element rather than
+        # a line element per bullet.
+        st.markdown(
+            "### Interests\n"
+            + "\n".join(f"- {x}" for x in info["interests"])
+            + "\n### Concerns\n"
+            + "\n".join(f"- {x}" for x in info["concerns"])
+            + "\n### Constraints\n"
+            + "\n".join(f"- {x}" for x in info["constraints"])
+        )
+
+        if st.session_state.current_offer:
+            st.subheader("Current Offer on the Table")
+            st.table(
+                _offer_rows(_offer_blob(st.session_state.current_offer))
+            )
+            case_id = st.session_state.get("case_id")
+            session = st.session_state.bargaining_sessions.get(case_id)
+            if session and st.button("🧮 Calculate My Utility"):
+                result = _eval_offer(
+                    case_id, tuple(session.parties),
+                    tuple(session.issue_space), party_id,
+                    _offer_blob(st.session_state.current_offer),
+                )
+                st.metric(
+                    "My Utility", f"{result['utilities'].get(party_id, 0):.1%}"
+                )
+                st.metric(
+                    "My Acceptance Probability",
+                    f"{result['acceptance'].get(party_id, 0):.1%}",
+                )
+
+    # ------------------------------------------------------------------
+    # Tab 2: make an offer
+    # ------------------------------------------------------------------
+    with tabs[1]:
+        standoff = st.slider("Standoff distance (nm)", 0, 10, 3,
+                             key="p_standoff")
+        escort = st.slider("Escort vessel limit", 0, 6, 2, key="p_escort")
+        prenotify = st.checkbox("48h prenotification", True, key="p_prenotify")
+        hotline = st.selectbox("Hotline status", ["active", "pilot", "none"],
+                               key="p_hotline")
+        cues = st.multiselect(
+            "CUES checklist",
+            ["radio_protocols", "signal_flags", "maneuvering",
+             "distance_keeping"],
+            default=["radio_protocols"],
+            key="p_cues",
+        )
+        embargo = st.slider("Incident embargo (hours)", 0, 72, 24,
+                            key="p_embargo")
+
+        offer = {
+            "standoff_distance_nm": standoff,
+            "escort_limits": escort,
+            "prenotification": prenotify,
+            "hotline": {"hotline_status": hotline, "cues_checklist": cues},
+            "media_protocol": {"embargo_hours": embargo},
+        }
+
+        case_id = st.session_state.get("case_id")
+        session = st.session_state.bargaining_sessions.get(case_id)
+        if session and st.button("🔍 Preview My Utility"):
+            # Repeat previews with untouched sliders skip even the
+            # serialization step: the widget tuple hash gates the call.
+            preview_key = hash(
+                (standoff, escort, prenotify, hotline, tuple(cues), embargo)
+            )
+            if preview_key != st.session_state.get("_last_preview_hash"):
+                st.session_state._last_preview_hash = preview_key
+                st.session_state._last_preview = _eval_offer(
+                    case_id, tuple(session.parties),
+                    tuple(session.issue_space), party_id, _offer_blob(offer),
+                )
+            result = st.session_state._last_preview
+            st.metric("Utility", f"{result['utilities'].get(party_id, 0):.1%}")
+        if st.button("📤 Submit Offer", type="primary"):
+            st.session_state.current_offer = offer
+            st.success("Offer submitted to the mediator.")
+
+    # ------------------------------------------------------------------
+    # Tab 3: strategy
+    # ------------------------------------------------------------------
+    with tabs[2]:
+        summary = _get_ctx(party_id).get_summary()
+
+        cards = []
+        for key, label, desc in _STRATEGY_METRICS:
+            val = summary[key]
+            color = _METRIC_COLORS[(val >= 40) + (val >= 60)]
+            cards.append(
+                _METRIC_CARD_TMPL.format(color=color, label=label,
+                                         val=val, desc=desc)
+            )
+        st.markdown(
+            "<div style='display:grid;"
+            "grid-template-columns:repeat(4,1fr);gap:10px'>"
+            + "".join(cards) + "</div>",
+            unsafe_allow_html=True,
+        )
+
+    # ------------------------------------------------------------------
+    # Tab 4: spoilers
+    # ------------------------------------------------------------------
+    with tabs[3]:
+        manager = st.session_state.spoiler_manager
+        for spoiler in manager.spoilers:
+            cap_emoji = _CAP_EMOJI.get(spoiler.capability.value, "🟢")
+            with st.expander(f"{cap_emoji} {spoiler.name}"):
+                strategies = tuple(
+                    manager.get_management_strategies(spoiler)[:3]
+                )
+                st.markdown(_render_spoiler_html(spoiler, strategies),
+                            unsafe_allow_html=True)
+
+    # ------------------------------------------------------------------
+    # Tab 5: multi-track diplomacy
+    # ------------------------------------------------------------------
+    with tabs[4]:
+        st.subheader("Track Overview")
+        st.markdown(_TRACK_OVERVIEW_HTML, unsafe_allow_html=True)
+
+        st.subheader("Recommendations")
+        recommendations = st.session_state.multi_track.get_track_recommendations(
+            escalation_risk=0.5, trust_level=0.4
+        )
+        st.markdown(
+            "".join(
+                f"<p style='color:#333;margin:2px 0;'>• {rec}</p>"
+                for rec in recommendations
+            ),
+            unsafe_allow_html=True,
+        )
+
+
+def _render_participant_ai_guide(party_id):
+    """AI guide sidebar block for a party delegation."""
+    with st.sidebar.expander("💬 AI Guide", expanded=False):
+        if "participant_ai_guide" not in st.session_state:
+            st.session_state.participant_ai_guide = create_participant_guide(
+                party_id, enable_persistence=True
+            )
+            # History alternates user/assistant, so the offset slices
+            # pair turns without per-item index bookkeeping.
+            history = st.session_state.participant_ai_guide.conversation_history
+            st.session_state.participant_chat_history = [
+                {
+                    "question": user.content,
+                    "response": reply.content,
+                    "sources": "Loaded from history",
+                }
+                for user, reply in zip(history[0::2], history[1::2])
+                if user.role == "user" and reply.role == "assistant"
+            ]
+        guide = st.session_state.participant_ai_guide
+
+        question = st.text_input("Ask about your strategy",
+                                 key="participant_question")
+        if st.button("Ask Assistant", key="participant_ask"):
+            party_strategic_context = _get_ctx(party_id)
+            summary = party_strategic_context.get_summary()
+            strategic_context_info = {
+                "diplomatic_capital": str(summary["diplomatic_capital"]),
+                "international_legitimacy": str(
+                    summary["international_legitimacy"]
+                ),
+                "domestic_support": str(summary["domestic_support"]),
+                "credibility": str(summary["credibility"]),
+                # The guide stores these as display strings, so build
+                # the final string directly rather than a throwaway
+                # list of fragments.
+                "strategic_actions_available": "; ".join(
+                    f"{action.name}: {action.description} "
+                    f"(Risk: {action.risk_level})"
+                    for action in get_available_actions(party_strategic_context)
+                ),
+            }
+            # Same descriptions the instructor guide uses; copy the
+            # module constant instead of rebuilding the literal per
+            # question.
+            sim_params = dict(SIMULATION_PARAMETER_DESCRIPTIONS)
+            sim_params.update(strategic_context_info)
+            guide.set_simulation_parameters(sim_params)
+            response, sources = guide.ask(question)
+            st.session_state.participant_chat_history.append(
+                {"question": question, "response": response, "sources": sources}
+            )
+
+        for chat in reversed(st.session_state.participant_chat_history[-2:]):
+            st.markdown(f"**Q:** {chat['question']}")
+            st.markdown(f"**A:** {chat['response']}")
+            st.caption(f"Source: {chat['sources']}")
+
+
+def render_enhanced_multi_view():
+    """Route to the view matching the selected role."""
+    _inject_global_css()
+    if st.session_state.role == "facilitator":
+        instructor_console()
+    else:
+        party_view()
+
+    if st.sidebar.button("🚪 Change Role"):
+        st.session_state.role = None
+        st.rerun()
+
+
+def main():
+    st.set_page_config(
+        page_title="SCS Multi-View Console", page_icon="🌊", layout="wide"
+    )
+    init_session_state()
+    if st.session_state.role is None:
+        role_selection()
+    else:
+        render_enhanced_multi_view()
+
+
+if __name__ == "__main__":
+    main()
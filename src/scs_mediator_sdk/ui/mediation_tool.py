@@ -0,0 +1,616 @@
+"""Phase-based mediation workflow tool.
+
+A six-phase guided mediation process for South China Sea maritime
+disputes, from initial contact through monitoring.  Offer evaluation is
+delegated to the bargaining API server (``API_URL``); everything else
+runs in-process.
+
+Run with: streamlit run src/scs_mediator_sdk/ui/mediation_tool.py
+"""
+
+import json
+import os
+import pathlib
+
+import numpy as np
+import streamlit as st
+
+try:
+    import orjson as _json
+    _loads = _json.loads
+except ImportError:
+    _loads = lambda b: json.loads(b.decode())  # noqa: E731
+
+# plotly, pandas and requests are imported inside the renderers that use
+# them: a session that stays in phases 1/3/4 never pays their import time
+# or resident memory, and sys.modules makes repeat imports near-free.
+
+
+@st.cache_resource
+def _resampler():
+    """Return FigureResampler when plotly-resampler is installed, else None.
+
+    Registration happens once per process, on the first phase that plots.
+    """
+    try:
+        from plotly_resampler import FigureResampler, register_plotly_resampler
+    except ImportError:
+        return None
+    register_plotly_resampler(mode="auto")
+    return FigureResampler
+
+API_URL = os.environ.get("SCS_BARGAINING_API", "http://localhost:8000")
+
+CASE_DIR = os.path.join("cases", "scs")
+
+PARTIES = ("Party A", "Party B", "Party C")
+
+# Widget keys are hashed into Streamlit's registry on every rerun; build
+# them once at import instead of re-allocating f-strings per rerun.
+_KEY = {
+    (kind, p): f"{kind}_{p}" for kind in ("mil", "eco") for p in PARTIES
+}
+
+# (label, description) per phase, built once at import rather than on
+# every navigator render.
+_PHASES = (
+    ("1️⃣ Initial Contact", "Build relationships and assess readiness"),
+    ("2️⃣ Conflict Assessment", "Map stakeholders, power and interests"),
+    ("3️⃣ Process Design", "Agree ground rules and agenda"),
+    ("4️⃣ Negotiation & Option Building", "Generate and reality-test options"),
+    ("5️⃣ Agreement Evaluation",
+     "Evaluate the draft agreement against party utilities"),
+    ("6️⃣ Implementation & Monitoring",
+     "Track compliance and adapt the agreement"),
+)
+
+
+@st.cache_resource
+def _http():
+    """One pooled HTTP session per server process."""
+    import requests
+
+    session = requests.Session()
+    session.headers["Accept"] = "application/x-ndjson"
+    return session
+
+
+@st.cache_resource
+def _case_index() -> dict:
+    """Mutable case-directory index shared across reruns."""
+    return {"mtime": 0.0, "files": []}
+
+
+def list_cases(case_dir: str) -> list:
+    """Case files under ``case_dir``, rescanned only when the directory
+    mtime changes.
+
+    One ``stat`` per rerun replaces an unconditional ``listdir`` plus the
+    implicit per-entry stats; ``scandir`` avoids them on the rescan too.
+    """
+    if not os.path.isdir(case_dir):
+        return []
+    idx = _case_index()
+    mtime = os.stat(case_dir).st_mtime
+    if mtime != idx["mtime"]:
+        idx["files"] = [
+            e.name for e in os.scandir(case_dir) if e.name.endswith(".json")
+        ]
+        idx["mtime"] = mtime
+    return idx["files"]
+
+
+@st.cache_data(show_spinner=False)
+def _load_case(path: str, mtime: float) -> dict:
+    """Parse a case file with orjson (single read syscall, C parser).
+
+    ``mtime`` is part of the cache key so edits on disk invalidate the
+    memoized parse.
+    """
+    return _loads(pathlib.Path(path).read_bytes())
+
+
+@st.cache_data
+def _stk_df(n: int, rows: tuple):
+    """Stakeholder table, cached on a cheap hashable key.
+
+    ``rows`` is a tuple of (name, role) pairs so Streamlit hashes small
+    immutable values instead of the list of dicts in session state.
+    """
+    import pandas as pd
+
+    return pd.DataFrame(rows, columns=["name", "role"])
+
+
+def init_session_state():
+    if "current_phase" not in st.session_state:
+        st.session_state.current_phase = 1
+    if "stakeholder_assessment" not in st.session_state:
+        st.session_state.stakeholder_assessment = {"stakeholders": []}
+    if "power_profile" not in st.session_state:
+        st.session_state.power_profile = {}
+    if "agreement_draft" not in st.session_state:
+        st.session_state.agreement_draft = {"options": []}
+    if "evaluation_results" not in st.session_state:
+        st.session_state.evaluation_results = None
+
+
+def render_phase_navigator():
+    """Sidebar phase list with Previous/Next navigation."""
+    st.sidebar.title("🕊️ Mediation Phases")
+    current = st.session_state.current_phase
+    for i, (phase, desc) in enumerate(_PHASES, 1):
+        # index 0: done, 1: current, 2: upcoming
+        render = (st.sidebar.info, st.sidebar.success, st.sidebar.text)[
+            (i >= current) + (i > current)
+        ]
+        render(phase)
+        if i == current:
+            st.sidebar.caption(desc)
+
+    col1, col2 = st.sidebar.columns(2)
+    with col1:
+        if current > 1 and st.button("⬅️ Previous"):
+            new = current - 1
+            # rerun() is the most expensive call on this path; skip it
+            # when a double-click already landed us on the target phase.
+            if new != st.session_state.current_phase:
+                st.session_state.current_phase = new
+                st.rerun()
+    with col2:
+        if current < 6 and st.button("Next ➡️"):
+            new = current + 1
+            if new != st.session_state.current_phase:
+                st.session_state.current_phase = new
+                st.rerun()
+
+
+def render_phase_1():
+    """Phase 1: initial contact and stakeholder mapping."""
+    st.header("1️⃣ Initial Contact")
+    st.markdown("Identify stakeholders and assess readiness to mediate.")
+
+    col1, col2 = st.columns(2)
+    with col1:
+        stakeholder_name = st.text_input("Stakeholder name")
+    with col2:
+        stakeholder_role = st.selectbox(
+            "Role", ["Primary party", "Secondary party", "Observer", "Guarantor"]
+        )
+
+    if st.button("➕ Add Stakeholder"):
+        if stakeholder_name.strip():
+            st.session_state.stakeholder_assessment["stakeholders"].append(
+                {"name": stakeholder_name.strip(), "role": stakeholder_role}
+            )
+            st.rerun()
+
+    # Adding M stakeholders one button-click at a time costs M reruns and
+    # M table rebuilds; the bulk path extends the list in a single rerun.
+    bulk = st.text_area("Bulk add (one name per line)")
+    if st.button("➕ Add all"):
+        new = [
+            {"name": line.strip(), "role": stakeholder_role}
+            for line in bulk.splitlines()
+            if line.strip()
+        ]
+        if new:
+            st.session_state.stakeholder_assessment["stakeholders"].extend(new)
+            st.rerun()
+
+    stakeholders = st.session_state.stakeholder_assessment["stakeholders"]
+    if stakeholders:
+        st.subheader("Stakeholder Map")
+        rows = tuple((s["name"], s["role"]) for s in stakeholders)
+        st.dataframe(_stk_df(len(stakeholders), rows), use_container_width=True)
+
+
+@st.fragment
+def _power_tab():
+    """Power-analysis sliders and chart, rerun in isolation.
+
+    As a fragment, slider changes rerun only this subtree instead of the
+    whole script (sidebar, other tabs, session checks).
+    """
+    import plotly.graph_objects as go
+
+    st.markdown("Rate each party's leverage (0-10).")
+    military = {}
+    economic = {}
+    for party in PARTIES:
+        col1, col2 = st.columns(2)
+        with col1:
+            military[party] = st.slider(
+                f"{party} military leverage", 0, 10, 5, key=_KEY[("mil", party)]
+            )
+        with col2:
+            economic[party] = st.slider(
+                f"{party} economic leverage", 0, 10, 5, key=_KEY[("eco", party)]
+            )
+    st.session_state.power_profile = {
+        "military": military,
+        "economic": economic,
+    }
+
+    # Build the figure once per session and mutate only the trace data
+    # on slider changes; re-running layout is the slow path, and the
+    # pinned uirevision keeps zoom/pan state across updates.
+    if "power_fig" not in st.session_state:
+        fig = go.Figure(
+            data=[
+                go.Bar(name="Military", x=list(PARTIES), y=[0] * len(PARTIES)),
+                go.Bar(name="Economic", x=list(PARTIES), y=[0] * len(PARTIES)),
+            ]
+        )
+        fig.update_layout(
+            barmode="group",
+            title="Power Distribution",
+            transition_duration=0,
+            uirevision="power",
+        )
+        fig.update_traces(marker_line_width=0)
+        fig.update_xaxes(showgrid=False)
+        st.session_state.power_fig = fig
+    fig = st.session_state.power_fig
+    fig.data[0].y = [military[p] for p in PARTIES]
+    fig.data[1].y = [economic[p] for p in PARTIES]
+    st.plotly_chart(fig, use_container_width=True)
+
+
+def render_phase_2():
+    """Phase 2: conflict assessment - interests, power, positions."""
+    st.header("2️⃣ Conflict Assessment")
+    tabs = st.tabs(["🎯 Interests", "⚖️ Power Analysis", "🗺️ Positions"])
+
+    with tabs[0]:
+        st.text_area("Underlying interests by party", key="interests_notes")
+
+    with tabs[1]:
+        _power_tab()
+
+    with tabs[2]:
+        st.text_area("Stated positions by party", key="positions_notes")
+
+
+def render_phase_3():
+    """Phase 3: process design - ground rules and agenda."""
+    st.header("3️⃣ Process Design")
+    st.multiselect(
+        "Ground rules",
+        [
+            "No attribution outside the room",
+            "One speaker at a time",
+            "Caucuses on request",
+            "Joint drafting of agreements",
+        ],
+        key="ground_rules",
+    )
+    st.text_area("Agenda (one item per line)", key="agenda_items")
+
+
+def _score_options(options: list) -> tuple:
+    """Vectorized reality-testing scores for N options at once.
+
+    Returns (avg, category) arrays; the single-option UI is just the
+    N=1 case, and sweep mode scores every stored option in one pass.
+    """
+    scores = np.array(
+        [[o["feas"], o["dur"], o["fair"], o["eff"]] for o in options],
+        dtype=np.float32,
+    )
+    avg = scores.mean(axis=1)
+    category = np.select(
+        [avg >= 0.75, avg >= 0.5], ["strong", "moderate"], default="weak"
+    )
+    return avg, category
+
+
+def render_phase_4():
+    """Phase 4: option generation and reality testing."""
+    st.header("4️⃣ Negotiation & Option Building")
+
+    option_text = st.text_input("Proposed option")
+    if st.button("➕ Add Option"):
+        if option_text.strip():
+            st.session_state.agreement_draft["options"].append(
+                {"text": option_text.strip(), "feas": 0.5, "dur": 0.5,
+                 "fair": 0.5, "eff": 0.5}
+            )
+            st.rerun()
+
+    bulk = st.text_area("Bulk add options (one per line)")
+    if st.button("➕ Add all options"):
+        new = [
+            {"text": line.strip(), "feas": 0.5, "dur": 0.5, "fair": 0.5, "eff": 0.5}
+            for line in bulk.splitlines()
+            if line.strip()
+        ]
+        if new:
+            st.session_state.agreement_draft["options"].extend(new)
+            st.rerun()
+
+    options = st.session_state.agreement_draft["options"]
+    if options:
+        st.subheader("Reality Testing")
+        selected = st.selectbox(
+            "Option to test", range(len(options)),
+            format_func=lambda i: options[i]["text"],
+        )
+        option = options[selected]
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            option["feas"] = st.slider("Feasibility", 0.0, 1.0, option["feas"])
+        with col2:
+            option["dur"] = st.slider("Durability", 0.0, 1.0, option["dur"])
+        with col3:
+            option["fair"] = st.slider("Fairness", 0.0, 1.0, option["fair"])
+        with col4:
+            option["eff"] = st.slider("Efficiency", 0.0, 1.0, option["eff"])
+
+        avg, category = _score_options([option])
+        status = {"strong": st.success, "moderate": st.warning}.get(
+            category[0], st.error
+        )
+        status(f"{category[0].title()} option — average score {avg[0]:.2f}")
+
+        if len(options) > 1:
+            import pandas as pd
+
+            st.subheader("All Options")
+            avgs, categories = _score_options(options)
+            st.dataframe(
+                pd.DataFrame(
+                    {
+                        "option": [o["text"] for o in options],
+                        "score": avgs,
+                        "rating": categories,
+                    }
+                ),
+                hide_index=True,
+                use_container_width=True,
+            )
+
+
+def render_phase_5():
+    """Phase 5: evaluate the draft agreement against the bargaining API."""
+    import pandas as pd
+    import requests
+
+    st.header("5️⃣ Agreement Evaluation")
+
+    case_files = list_cases(CASE_DIR)
+    if not case_files:
+        st.warning(f"No case files found under {CASE_DIR}.")
+        return
+
+    case_file = st.selectbox("Case file", case_files)
+    case_path = os.path.join(CASE_DIR, case_file)
+    case = _load_case(case_path, os.path.getmtime(case_path))
+    st.caption(f"Case: {case.get('title', case_file)}")
+
+    if st.button("📊 Evaluate Offer", type="primary"):
+        payload = {
+            "case": case,
+            "options": st.session_state.agreement_draft["options"],
+        }
+        col_util, col_accept = st.columns(2)
+        with col_util:
+            st.subheader("Utilities")
+            util_placeholder = st.empty()
+        with col_accept:
+            st.subheader("Acceptance Probability")
+            accept_placeholder = st.empty()
+
+        # Stream newline-delimited JSON so each party's result renders as
+        # soon as the server produces it, instead of blocking on the full
+        # response.
+        utilities = {}
+        acceptance = {}
+        try:
+            with _http().post(
+                f"{API_URL}/evaluate", json=payload, stream=True, timeout=60
+            ) as r:
+                r.raise_for_status()
+                for line in r.iter_lines():
+                    if not line:
+                        continue
+                    d = json.loads(line)
+                    utilities[d["party"]] = d["util"]
+                    acceptance[d["party"]] = d["accept_p"]
+                    with util_placeholder.container():
+                        for party, util in utilities.items():
+                            st.metric(party, f"{util:.2%}")
+                    with accept_placeholder.container():
+                        for party, prob in acceptance.items():
+                            st.metric(party, f"{prob:.2%}")
+        except requests.RequestException as exc:
+            st.error(f"Bargaining API unavailable: {exc}")
+            return
+
+        st.session_state.evaluation_results = {
+            "utilities": utilities,
+            "acceptance_prob": acceptance,
+        }
+
+    results = st.session_state.evaluation_results
+    if results:
+        st.subheader("Last Evaluation")
+        # One dataframe render instead of 2N st.metric components.
+        df = pd.DataFrame(
+            {
+                "party": list(results["utilities"]),
+                "utility": list(results["utilities"].values()),
+                "accept_p": [
+                    results["acceptance_prob"][p] for p in results["utilities"]
+                ],
+            }
+        )
+        st.dataframe(
+            df.style.format({"utility": "{:.2%}", "accept_p": "{:.2%}"}),
+            hide_index=True,
+            use_container_width=True,
+        )
+
+
+@st.cache_data(ttl=5, show_spinner=False)
+def _monitoring_snapshot(session_key: str) -> dict:
+    """Monitoring metrics from the API, TTL-bounded so brief UI
+    interactions reuse the last snapshot while stale values self-refresh.
+    """
+    import requests
+
+    try:
+        r = _http().get(f"{API_URL}/monitor/{session_key}", timeout=5)
+        r.raise_for_status()
+        return r.json()
+    except requests.RequestException:
+        # Offline default mirrors the API response shape.
+        return {
+            "incidents": 3,
+            "delta_incidents": -1,
+            "hotline_minutes": 14,
+            "delta_hotline": -3,
+        }
+
+
+@st.cache_data(show_spinner=False)
+def _compliance_samples(util_key: tuple, power_key: tuple, n_trials: int) -> np.ndarray:
+    """Monte-Carlo compliance samples, memoized per (utilities, power)."""
+    from scs_mediator_sdk.ui._sim_kernels import simulate_compliance
+
+    util = np.asarray(util_key, dtype=np.float64)
+    power = np.asarray(power_key, dtype=np.float64)
+    return simulate_compliance(util, power, n_trials, 42)
+
+
+def render_phase_6():
+    """Phase 6: implementation monitoring dashboard."""
+    import plotly.graph_objects as go
+
+    st.header("6️⃣ Implementation & Monitoring")
+    tabs = st.tabs(["📈 Monitoring Dashboard", "📋 Compliance Log"])
+
+    with tabs[0]:
+        results = st.session_state.evaluation_results
+        if results:
+            util_key = tuple(results["utilities"].values())
+        else:
+            util_key = (0.6,) * len(PARTIES)
+        military = st.session_state.power_profile.get("military", {})
+        power_key = tuple(military.get(p, 5) for p in PARTIES)
+
+        samples = _compliance_samples(util_key, power_key, 10_000)
+        compliance = float(samples.mean())
+
+        snap = _monitoring_snapshot("default")
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Compliance Rate", f"{compliance:.0%}")
+        with col2:
+            st.metric(
+                "Incidents This Month",
+                str(snap["incidents"]),
+                str(snap["delta_incidents"]),
+            )
+        with col3:
+            st.metric(
+                "Hotline Response Time",
+                f"{snap['hotline_minutes']} min",
+                f"{snap['delta_hotline']} min",
+            )
+
+        ts = np.arange(30)
+        compliance_series = np.asarray(compliance + 0.003 * (ts - ts.mean()))
+        # Downsample long incident series server-side so the browser only
+        # receives view-relevant points; with the resampler unavailable we
+        # fall back to sending the raw trace.
+        FigureResampler = _resampler()
+        if FigureResampler is not None:
+            fig = FigureResampler(go.Figure())
+            fig.add_trace(
+                go.Scattergl(name="compliance"), hf_x=ts, hf_y=compliance_series
+            )
+        else:
+            fig = go.Figure()
+            fig.add_trace(go.Scattergl(x=ts, y=compliance_series, name="compliance"))
+        fig.update_layout(title="Compliance Over Time", yaxis_tickformat=".0%")
+        st.plotly_chart(fig, use_container_width=True)
+
+    with tabs[1]:
+        st.text_area("Log entry")
+        st.button("➕ Record Entry")
+
+
+def render_scenario_builder():
+    """Scenario template editor, reachable from the sidebar."""
+    st.header("🧩 Scenario Builder")
+
+    # The form batches every input locally in the browser: keystrokes and
+    # slider drags no longer rerun the script, only Save does.
+    with st.form("scenario_builder", clear_on_submit=False):
+        name = st.text_input("Scenario name")
+        region = st.selectbox("Region", ["Spratly Islands", "Paracel Islands", "Scarborough Shoal"])
+        description = st.text_area("Background description")
+        num_parties = st.number_input("Number of parties", 2, 6, 3)
+        num_issues = st.number_input("Number of issues", 1, 10, 3)
+        difficulty = st.slider("Difficulty", 1, 5, 3)
+
+        parties = []
+        for i in range(int(num_parties)):
+            with st.expander(f"Party {i + 1}"):
+                p_name = st.text_input("Name", key=f"party_name_{i}")
+                p_batna = st.slider("BATNA strength", 0.0, 1.0, 0.5, key=f"party_batna_{i}")
+                p_power = st.slider("Power", 0.0, 1.0, 0.5, key=f"party_power_{i}")
+                p_flex = st.slider("Flexibility", 0.0, 1.0, 0.5, key=f"party_flex_{i}")
+                parties.append({"name": p_name, "batna": p_batna, "power": p_power,
+                                "flexibility": p_flex})
+
+        issues = []
+        for i in range(int(num_issues)):
+            with st.expander(f"Issue {i + 1}"):
+                i_name = st.text_input("Issue name", key=f"issue_name_{i}")
+                i_weight = st.slider("Weight", 0.0, 1.0, 0.5, key=f"issue_weight_{i}")
+                issues.append({"name": i_name, "weight": i_weight})
+
+        submitted = st.form_submit_button("💾 Save Scenario Template")
+
+    if submitted:
+        template = {
+            "name": name,
+            "region": region,
+            "description": description,
+            "difficulty": difficulty,
+            "parties": parties,
+            "issues": issues,
+        }
+        os.makedirs(CASE_DIR, exist_ok=True)
+        out_path = os.path.join(CASE_DIR, f"{name or 'scenario'}.json")
+        with open(out_path, "w") as f:
+            json.dump(template, f, indent=2)
+        st.success(f"Saved to {out_path}")
+
+
+_PHASE_RENDERERS = (
+    render_phase_1,
+    render_phase_2,
+    render_phase_3,
+    render_phase_4,
+    render_phase_5,
+    render_phase_6,
+)
+
+
+def main():
+    st.set_page_config(page_title="SCS Mediation Tool", page_icon="🕊️", layout="wide")
+    init_session_state()
+    render_phase_navigator()
+
+    if st.sidebar.checkbox("🧩 Scenario Builder"):
+        render_scenario_builder()
+        return
+
+    _PHASE_RENDERERS[st.session_state.current_phase - 1]()
+
+
+if __name__ == "__main__":
+    main()
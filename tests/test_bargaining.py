@@ -0,0 +1,68 @@
+"""Regression tests for offer scoring in bargaining sessions.
+
+Guards the term -> issue wiring: every offer the UIs can produce must
+actually move utilities, not fall through to the unaddressed midpoint.
+"""
+
+from scs_mediator_sdk.bargaining import (
+    AgreementVector,
+    BargainingSession,
+    _issue_for_term,
+)
+
+_ISSUES = ["resupply_SOP", "naval_restrictions", "hotline_cues",
+           "media_protocol"]
+
+_LOW_OFFER = {
+    "standoff_distance_nm": 0,
+    "escort_limits": 0,
+    "prenotification": False,
+    "hotline": {"hotline_status": "none", "cues_checklist": []},
+    "media_protocol": {"embargo_hours": 0, "joint_statements": False},
+}
+
+_HIGH_OFFER = {
+    "standoff_distance_nm": 10,
+    "escort_limits": 6,
+    "prenotification": True,
+    "hotline": {
+        "hotline_status": "active",
+        "cues_checklist": ["radio_protocols", "signal_flags",
+                           "maneuvering", "distance_keeping"],
+    },
+    "media_protocol": {"embargo_hours": 72, "joint_statements": True},
+}
+
+
+def _session():
+    return BargainingSession.start(
+        "test_case", ["PH_GOV", "PRC_MARITIME"], "ASEAN chair", _ISSUES
+    )
+
+
+def test_offer_terms_map_to_issue_space():
+    for terms in (_LOW_OFFER, _HIGH_OFFER):
+        for term in AgreementVector(terms).flattened():
+            assert _issue_for_term(term) in _ISSUES
+
+
+def test_changing_offer_changes_profile_utility():
+    session = _session()
+    for profile in session.profiles.values():
+        low = profile.utility(AgreementVector(_LOW_OFFER))
+        high = profile.utility(AgreementVector(_HIGH_OFFER))
+        assert low != high
+
+
+def test_changing_offer_changes_evaluation():
+    low = _session().evaluate_offer("PH_GOV", AgreementVector(_LOW_OFFER))
+    high = _session().evaluate_offer("PH_GOV", AgreementVector(_HIGH_OFFER))
+    assert low["utilities"] != high["utilities"]
+
+
+def test_array_kernel_matches_profile_utility():
+    session = _session()
+    offer = AgreementVector(_HIGH_OFFER)
+    result = session.evaluate_offer("PH_GOV", offer)
+    for party, profile in session.profiles.items():
+        assert abs(result["utilities"][party] - profile.utility(offer)) < 1e-9